@@ -2,18 +2,42 @@
 Modular copilot commands package - Clean Architecture
 
 Only ONE command for data collection. Claude does everything else.
+
+Submodules are imported lazily (PEP 562) so entrypoints that only list
+commands don't pay for the GitHub client imports.
 """
 
-from .base import CopilotCommandBase
-from .commentfetch import CommentFetch
-from .utils import GitHubAPI, JSONSchemas
+import importlib
 
-# Command registry - ONLY data collection commands
-COMMAND_REGISTRY = {
-    "commentfetch": CommentFetch,
+# Command registry - ONLY data collection commands, as (submodule, class)
+_COMMANDS = {
+    "commentfetch": ("commentfetch", "CommentFetch"),
     # That's it! Claude handles everything else
 }
 
+_EXPORTS = {
+    "CopilotCommandBase": ("base", "CopilotCommandBase"),
+    "CommentFetch": ("commentfetch", "CommentFetch"),
+    "GitHubAPI": ("utils", "GitHubAPI"),
+    "JSONSchemas": ("utils", "JSONSchemas"),
+}
+
+
+def _load(module: str, attr: str):
+    """Import ``attr`` from a submodule on first use."""
+    return getattr(importlib.import_module(f".{module}", __name__), attr)
+
+
+def __getattr__(name: str):
+    if name == "COMMAND_REGISTRY":
+        value = {command: _load(*target) for command, target in _COMMANDS.items()}
+    elif name in _EXPORTS:
+        value = _load(*_EXPORTS[name])
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
 
 def get_command(name: str):
     """Get command class by name.
@@ -24,7 +48,8 @@ def get_command(name: str):
     Returns:
         Command class or None if not found
     """
-    return COMMAND_REGISTRY.get(name)
+    target = _COMMANDS.get(name)
+    return _load(*target) if target else None
 
 
 def list_commands():
@@ -33,7 +58,7 @@ def list_commands():
     Returns:
         List of command names
     """
-    return list(COMMAND_REGISTRY.keys())
+    return list(_COMMANDS.keys())
 
 
 # Export only what's needed for data collection
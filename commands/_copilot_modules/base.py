@@ -9,102 +9,371 @@ Provides:
 - Verification patterns from PR #796
 """
 
+import asyncio
+import functools
+import inspect
 import json
 import os
+import re
+import shutil
+import signal
 import subprocess
 import sys
+import threading
 import time
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import gh_http
+from gh_http import GH_ERRORS, STATUS_CHECK_ROLLUP_FIELDS, get_client
+
+# PR #941 standard: replace any non-alphanumeric, non-dot, non-underscore, non-dash
+_BRANCH_UNSAFE_RE = re.compile(r"[^a-zA-Z0-9._-]")
+_BRANCH_LEADING_RE = re.compile(r"^[.-]+")
+# Common test result patterns ("12 passed", "1 failed", "3 errors", ...)
+_TEST_RESULT_RE = re.compile(
+    r"(?P<count>\d+) (?P<kind>passed|failed|skipped|error)", re.IGNORECASE
+)
+_TEST_RESULT_KEYS = {
+    "passed": "passed",
+    "failed": "failed",
+    "skipped": "skipped",
+    "error": "errors",
+}
+
+# GitHub secondary rate limits: cap concurrent calls, space out search calls
+GH_BATCH_CONCURRENCY = 5
+GH_SEARCH_DELAY = 0.2
+
+# Local CI replica limits: kill after 5 minutes, keep only the output tail
+CI_REPLICA_TIMEOUT = 300
+CI_OUTPUT_TAIL_LINES = 200
+
+# GraphQL fragments for fetch_pr_bundle - shaped to mirror the REST payloads
+_PR_BUNDLE_FRAGMENTS = {
+    "IssueCommentFields": """
+fragment IssueCommentFields on IssueComment {
+  databaseId body createdAt author { login __typename }
+}""",
+    "ReviewFields": """
+fragment ReviewFields on PullRequestReview {
+  databaseId body submittedAt state author { login __typename }
+}""",
+    "ReviewCommentFields": """
+fragment ReviewCommentFields on PullRequestReviewComment {
+  databaseId body createdAt path line originalLine position
+  author { login __typename } replyTo { databaseId }
+}""",
+    "ThreadFields": """
+fragment ThreadFields on PullRequestReviewThread {
+  comments(first: 100) { nodes { ...ReviewCommentFields } }
+}""",
+}
+
+_PAGE_INFO = "pageInfo { hasNextPage endCursor }"
+
+PR_BUNDLE_QUERY = (
+    """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      mergeable
+      mergeStateStatus
+      comments(first: 100) { %(page)s nodes { ...IssueCommentFields } }
+      reviews(last: 100) { nodes { ...ReviewFields } }
+      reviewThreads(first: 100) { %(page)s nodes { ...ThreadFields } }
+      commits(last: 1) {
+        nodes {
+          commit {
+            statusCheckRollup { %(rollup)s }
+          }
+        }
+      }
+    }
+  }
+}"""
+    % {"page": _PAGE_INFO, "rollup": STATUS_CHECK_ROLLUP_FIELDS}
+    + "".join(_PR_BUNDLE_FRAGMENTS.values())
+)
+
+# Follow-up query for a single collection that overflowed its first page
+_PR_BUNDLE_PAGE_QUERY = """
+query($owner: String!, $name: String!, $number: Int!, $cursor: String!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      %(field)s(first: 100, after: $cursor) { %(page)s nodes { ...%(fragment)s } }
+    }
+  }
+}"""
+
+# Collections fetch_pr_bundle extracts; any returning pageInfo is paged to
+# the end. Reviews are requested as the latest 100 only (no pageInfo) - a
+# single page covers the review state callers act on.
+_PR_BUNDLE_COLLECTIONS = {
+    "comments": ("IssueCommentFields",),
+    "reviews": ("ReviewFields",),
+    "reviewThreads": ("ThreadFields", "ReviewCommentFields"),
+}
+
+_ORIGIN_URL_RE = re.compile(
+    r'^\s*\[remote "origin"\][^\[]*?^\s*url\s*=\s*(\S+)', re.MULTILINE
+)
+
+
+def _scan_test_results(text: str, results: Dict[str, int], seen: set) -> None:
+    """Fold test counts found in ``text`` into ``results``; first count per kind wins."""
+    for match in _TEST_RESULT_RE.finditer(text):
+        key = _TEST_RESULT_KEYS[match.group("kind").lower()]
+        if key not in seen:
+            seen.add(key)
+            results[key] = int(match.group("count"))
+
+
+def _to_iso(ns: int) -> str:
+    """Format a ``time.time_ns()`` stamp as an ISO-8601 UTC string."""
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+
+
+def _login(node: Dict[str, Any]) -> Dict[str, str]:
+    """REST-style user object from a GraphQL author (null for deleted users)."""
+    author = node.get("author") or {}
+    return {
+        "login": author.get("login", "unknown"),
+        # GraphQL __typename is "Bot" or "User", matching REST user.type
+        "type": author.get("__typename", "User"),
+    }
+
+
+def _parse_github_remote(url: str) -> Optional[str]:
+    """Extract owner/name from a github.com remote URL (ssh or https)."""
+    if "github.com" not in url:
+        return None
+    if url.endswith(".git"):
+        url = url[:-4]
+    if "://" in url:
+        return "/".join(url.split("/")[-2:])
+    return url.split(":")[-1]
+
+
+@functools.lru_cache(maxsize=8)
+def _git_dirs_for(cwd: str) -> Optional[Tuple[str, str]]:
+    """Locate (git_dir, common_dir) by walking up from ``cwd``.
+
+    Handles linked worktrees, where ``.git`` is a file pointing at the real
+    git dir and ``commondir`` points back at the shared config.
+    Returns None when no repository is found or the layout is unexpected.
+    """
+    directory = os.path.abspath(cwd)
+    while True:
+        dot_git = os.path.join(directory, ".git")
+        if os.path.isdir(dot_git):
+            return dot_git, dot_git
+        if os.path.isfile(dot_git):
+            try:
+                with open(dot_git) as f:
+                    pointer = f.read().strip()
+                if not pointer.startswith("gitdir:"):
+                    return None
+                git_dir = os.path.normpath(
+                    os.path.join(directory, pointer[len("gitdir:"):].strip())
+                )
+                common_dir = git_dir
+                commondir_file = os.path.join(git_dir, "commondir")
+                if os.path.isfile(commondir_file):
+                    with open(commondir_file) as f:
+                        common_dir = os.path.normpath(
+                            os.path.join(git_dir, f.read().strip())
+                        )
+                return git_dir, common_dir
+            except OSError:
+                return None
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def _read_origin_url(cwd: str) -> Optional[str]:
+    """Read remote.origin.url straight from the git config file."""
+    dirs = _git_dirs_for(cwd)
+    if dirs is None:
+        return None
+    try:
+        with open(os.path.join(dirs[1], "config")) as f:
+            match = _ORIGIN_URL_RE.search(f.read())
+    except OSError:
+        return None
+    return match.group(1) if match else None
+
+
+def _read_head_branch(cwd: str) -> Optional[str]:
+    """Read the current branch from HEAD; "" when detached, None if unreadable."""
+    dirs = _git_dirs_for(cwd)
+    if dirs is None:
+        return None
+    try:
+        with open(os.path.join(dirs[0], "HEAD")) as f:
+            head = f.read().strip()
+    except OSError:
+        return None
+    if head.startswith("ref: refs/heads/"):
+        return head[len("ref: refs/heads/"):]
+    if re.fullmatch(r"[0-9a-f]{40,64}", head):
+        return ""  # Detached HEAD, same as `git branch --show-current`
+    return None
+
+
+@functools.lru_cache(maxsize=8)
+def _repo_info_for(cwd: str) -> str:
+    """Resolve owner/name for the repository at ``cwd``.
+
+    Reads the origin URL from the on-disk git config (no fork), then tries
+    `git remote get-url`, and only falls back to the GitHub CLI when the
+    remote cannot be parsed.
+    """
+    repo = _parse_github_remote(_read_origin_url(cwd) or "")
+    if repo:
+        return repo
+
+    try:
+        output = subprocess.check_output(
+            ["git", "remote", "get-url", "origin"],
+            text=True,
+            stderr=subprocess.DEVNULL,
+            cwd=cwd,
+        )
+        repo = _parse_github_remote(output.strip())
+        if repo:
+            return repo
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        pass
+
+    try:
+        output = subprocess.check_output(
+            ["gh", "repo", "view", "--json", "nameWithOwner"],
+            text=True,
+            stderr=subprocess.DEVNULL,
+            cwd=cwd,
+        )
+        return json.loads(output)["nameWithOwner"]
+    except (subprocess.CalledProcessError, FileNotFoundError, json.JSONDecodeError, KeyError):
+        return os.environ.get(
+            "DEFAULT_REPO", "jleechanorg/worldarchitect.ai"
+        )  # Default fallback
+
+
+@functools.lru_cache(maxsize=8)
+def _current_branch_for(cwd: str) -> str:
+    """Return the raw (unsanitized) current branch for the repository at ``cwd``.
+
+    Reads ``HEAD`` directly and only forks git if the layout is unexpected.
+    """
+    branch = _read_head_branch(cwd)
+    if branch is not None:
+        return branch
+    return subprocess.check_output(
+        ["git", "branch", "--show-current"],
+        text=True,
+        stderr=subprocess.DEVNULL,
+        cwd=cwd,
+    ).strip()
 
 
 class CopilotCommandBase(ABC):
     """Base class for all modular copilot commands."""
 
+    # Resolved CI replica scripts keyed on (cwd, script_path)
+    _ci_script_cache: Dict[Tuple[str, str], str] = {}
+
     def __init__(self, pr_number: Optional[str] = None):
         """Initialize base command.
 
         Args:
             pr_number: GitHub PR number (optional for some commands)
         """
+        # Resolve log formatting once rather than on every log call
+        self._ci = bool(os.environ.get("CI") or os.environ.get("GITHUB_ACTIONS"))
+        self._log_prefix = f"[{type(self).__name__}]"
         self.pr_number = pr_number
-        self.start_time = datetime.now()
+        self.start_time = datetime.now()  # Wall-clock start, for display only
+        self._start_perf = time.perf_counter()
+        # Repo and branch lookups are cached per working directory - they
+        # don't change within a process, so repeat instantiations don't fork
         self.repo = self._get_repo_info()
         self.current_branch = self._get_current_branch()
+        self._http = get_client()
 
         # No caching - always fetch fresh data from GitHub API
 
     def _get_repo_info(self) -> str:
-        """Get repository info from GitHub CLI or git remote."""
-        try:
-            result = subprocess.run(
-                ["gh", "repo", "view", "--json", "nameWithOwner"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            data = json.loads(result.stdout)
-            return data["nameWithOwner"]
-        except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError):
-            # Fallback to git remote parsing
-            try:
-                result = subprocess.run(
-                    ["git", "remote", "get-url", "origin"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                url = result.stdout.strip()
-                if "github.com" in url:
-                    if url.endswith(".git"):
-                        url = url[:-4]
-                    if ":" in url:
-                        return url.split(":")[-1]
-                    else:
-                        return "/".join(url.split("/")[-2:])
-            except subprocess.CalledProcessError:
-                pass
-            return os.environ.get(
-                "DEFAULT_REPO", "jleechanorg/worldarchitect.ai"
-            )  # Default fallback
+        """Get repository info from git remote, falling back to GitHub CLI."""
+        return _repo_info_for(os.getcwd())
 
     def _get_current_branch(self) -> str:
         """Get current git branch for branch-specific file naming."""
         try:
-            result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                capture_output=True,
-                text=True,
-                check=True,
-                cwd=os.getcwd(),
-            )
-            branch_name = result.stdout.strip()
-            return self._sanitize_branch_name(branch_name)
+            return self._sanitize_branch_name(_current_branch_for(os.getcwd()))
         except Exception:
             return "unknown-branch"
 
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Drop cached repo/branch lookups (e.g. after a checkout or in tests)."""
+        _git_dirs_for.cache_clear()
+        _repo_info_for.cache_clear()
+        _current_branch_for.cache_clear()
+        cls._ci_script_cache.clear()
+
     def _sanitize_branch_name(self, branch_name: str) -> str:
         """Sanitize branch name using PR #941 standard pattern for consistency."""
-        import re
-
         # PR #941 standard: Replace any non-alphanumeric, non-dot, non-underscore, non-dash with underscore
-        sanitized = re.sub(r"[^a-zA-Z0-9._-]", "_", branch_name)
+        sanitized = _BRANCH_UNSAFE_RE.sub("_", branch_name)
         # Remove leading dots/dashes for filesystem safety
-        sanitized = re.sub(r"^[.-]+", "", sanitized)
+        sanitized = _BRANCH_LEADING_RE.sub("", sanitized)
         return sanitized or "unknown-branch"
 
-    def run_gh_command(self, command: List[str]) -> Dict[str, Any]:
-        """Run GitHub CLI command and return parsed JSON.
+    def gh_get(self, path: str, paginate: bool = False) -> Any:
+        """GET a GitHub REST path over the pooled session (gh CLI fallback).
+
+        Args:
+            path: API path such as ``repos/{owner}/{repo}/issues/1/comments``
+            paginate: Merge all list pages like ``gh api --paginate``
+
+        Returns:
+            Parsed JSON response or empty dict on error
+        """
+        try:
+            return gh_http.gh_get(path, paginate=paginate)
+        except GH_ERRORS as e:
+            self.log_error(f"GitHub API error: {getattr(e, 'stderr', None) or e}")
+            return {}
+
+    def run_gh_command(self, command: List[str], stdin: Optional[str] = None) -> Dict[str, Any]:
+        """Run a GitHub API call and return parsed JSON.
+
+        Plain ``gh api <path> [--paginate]`` commands go through gh_get and the
+        pooled HTTPS session; anything else runs through the GitHub CLI.
 
         Args:
             command: Command list for subprocess
+            stdin: Text fed to the command (e.g. a body for ``--input -``)
 
         Returns:
             Parsed JSON response or empty dict on error
         """
+        if stdin is None and command[:2] == ["gh", "api"] and len(command) >= 3 and set(
+            command[3:]
+        ) <= {"--paginate"}:
+            return self.gh_get(command[2], paginate="--paginate" in command)
+
         try:
-            result = subprocess.run(command, capture_output=True, text=True, check=True)
+            result = subprocess.run(
+                command, input=stdin, capture_output=True, text=True, check=True
+            )
             if not result.stdout.strip():
                 return {}
             return json.loads(result.stdout)
@@ -115,30 +384,221 @@ class CopilotCommandBase(ABC):
             self.log_error(f"JSON parsing error: {e}")
             return {}
 
+    def run_graphql(
+        self, query: str, variables: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Run a GraphQL query so several lookups share one round-trip.
+
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+
+        Returns:
+            The ``data`` member of the response or empty dict on error
+        """
+        try:
+            payload = gh_http.gh_graphql(query, variables)
+        except GH_ERRORS as e:
+            self.log_error(f"GitHub GraphQL error: {getattr(e, 'stderr', None) or e}")
+            return {}
+
+        if payload.get("errors"):
+            self.log_error(f"GraphQL errors: {payload['errors']}")
+        return payload.get("data") or {}
+
+    def _gh_call(self, method: str, path: str, **kwargs) -> Any:
+        """Run one GitHub API call, returning {} on error like run_gh_command."""
+        if self._http is None:
+            return self._gh_cli_call(method, path, **kwargs)
+        try:
+            return self._http.request(method, path, **kwargs)
+        except GH_ERRORS as e:
+            self.log_error(f"GitHub API error: {e}")
+            return {}
+
+    def _gh_cli_call(self, method: str, path: str, **kwargs) -> Any:
+        """``gh api`` equivalent of one session request, used without a session.
+
+        ``params`` become the query string, a ``json`` body is sent with
+        ``--input -`` and ``paginate`` maps to ``--paginate``. Any other
+        request option can't be expressed through the CLI, so the call is
+        refused (logged, {}) rather than sent without it.
+        """
+        params = kwargs.pop("params", None)
+        body = kwargs.pop("json", None)
+        paginate = kwargs.pop("paginate", False)
+        kwargs.pop("timeout", None)  # gh applies its own
+        if kwargs:
+            self.log_error(
+                f"GitHub CLI fallback can't send {', '.join(sorted(kwargs))} for {method} {path}"
+            )
+            return {}
+
+        if params:
+            path += ("&" if "?" in path else "?") + urlencode(params, doseq=True)
+        command = ["gh", "api", "-X", method, path]
+        if paginate:
+            command.append("--paginate")
+        if body is None:
+            return self.run_gh_command(command)
+        return self.run_gh_command(command + ["--input", "-"], stdin=json.dumps(body))
+
+    async def run_gh_batch(self, calls: List[Tuple]) -> List[Any]:
+        """Run several GitHub API calls concurrently.
+
+        Calls share the pooled session from worker threads, with at most
+        GH_BATCH_CONCURRENCY in flight; ``search/`` calls are additionally
+        spaced GH_SEARCH_DELAY apart. Sync callers can use
+        ``asyncio.run(self.run_gh_batch(calls))``.
+
+        Args:
+            calls: ``(method, path)`` or ``(method, path, kwargs)`` tuples
+
+        Returns:
+            Parsed responses in call order ({} for failed calls)
+        """
+        semaphore = asyncio.Semaphore(GH_BATCH_CONCURRENCY)
+
+        async def _one(call: Tuple) -> Any:
+            method, path, kwargs = (*call, {})[:3]
+            async with semaphore:
+                result = await asyncio.to_thread(self._gh_call, method, path, **kwargs)
+                if path.lstrip("/").startswith("search/"):
+                    await asyncio.sleep(GH_SEARCH_DELAY)
+                return result
+
+        return await asyncio.gather(*(_one(call) for call in calls))
+
+    def fetch_pr_bundle(self, pr_number: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch comments, reviews, review threads and checks in one GraphQL query.
+
+        Comment and review-thread collections longer than 100 entries are
+        paged with follow-up queries for that collection only; reviews are
+        limited to the latest 100. Nodes are normalized to the REST field
+        names the command standardizers already consume.
+
+        Args:
+            pr_number: PR number (defaults to the command's PR)
+
+        Returns:
+            Dict with ``general``, ``reviews``, ``inline``, ``status_checks``,
+            ``mergeable`` and ``merge_state_status``; empty dict on error
+        """
+        try:
+            number = int(pr_number or self.pr_number)
+        except (TypeError, ValueError):
+            self.log_error(f"Invalid PR number: {pr_number or self.pr_number!r}")
+            return {}
+        owner, _, name = self.repo.partition("/")
+        variables = {"owner": owner, "name": name, "number": number}
+        data = self.run_graphql(PR_BUNDLE_QUERY, variables)
+        pr = (data.get("repository") or {}).get("pullRequest")
+        if not pr:
+            return {}
+
+        collections = {}
+        for field, fragments in _PR_BUNDLE_COLLECTIONS.items():
+            connection = pr.get(field) or {}
+            nodes = list(connection.get("nodes") or [])
+            page_info = connection.get("pageInfo") or {}
+            while page_info.get("hasNextPage"):
+                query = _PR_BUNDLE_PAGE_QUERY % {
+                    "field": field,
+                    "page": _PAGE_INFO,
+                    "fragment": fragments[0],
+                } + "".join(_PR_BUNDLE_FRAGMENTS[f] for f in fragments)
+                data = self.run_graphql(query, {**variables, "cursor": page_info["endCursor"]})
+                pull_request = (data.get("repository") or {}).get("pullRequest") or {}
+                page = pull_request.get(field) or {}
+                nodes.extend(page.get("nodes") or [])
+                page_info = page.get("pageInfo") or {}
+            collections[field] = nodes
+
+        commits = (pr.get("commits") or {}).get("nodes") or []
+        rollup = (commits[-1]["commit"].get("statusCheckRollup") or {}) if commits else {}
+
+        return {
+            "general": [
+                {
+                    "id": c.get("databaseId"),
+                    "body": c.get("body", ""),
+                    "user": _login(c),
+                    "created_at": c.get("createdAt", ""),
+                }
+                for c in collections["comments"]
+            ],
+            "reviews": [
+                {
+                    "id": r.get("databaseId"),
+                    "body": r.get("body", ""),
+                    "user": _login(r),
+                    "submitted_at": r.get("submittedAt", ""),
+                    "state": r.get("state"),
+                }
+                for r in collections["reviews"]
+            ],
+            "inline": [
+                {
+                    "id": c.get("databaseId"),
+                    "body": c.get("body", ""),
+                    "user": _login(c),
+                    "created_at": c.get("createdAt", ""),
+                    "path": c.get("path"),
+                    "line": c.get("line"),
+                    "original_line": c.get("originalLine"),
+                    "position": c.get("position"),
+                    "in_reply_to_id": (c.get("replyTo") or {}).get("databaseId"),
+                }
+                for thread in collections["reviewThreads"]
+                for c in (thread.get("comments") or {}).get("nodes") or []
+            ],
+            # Same camelCase shape as `gh pr view --json statusCheckRollup`
+            "status_checks": (rollup.get("contexts") or {}).get("nodes") or [],
+            "mergeable": pr.get("mergeable"),
+            "merge_state_status": pr.get("mergeStateStatus"),
+        }
+
     # JSON file operations removed - using stateless approach
 
     def log(self, message: str):
         """Log informational message with timestamp in CI environments."""
-        if os.environ.get("CI") or os.environ.get("GITHUB_ACTIONS"):
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            print(f"[{timestamp}] [{self.__class__.__name__}] {message}", file=sys.stderr)
+        if self._ci:
+            print(f"[{time.strftime('%H:%M:%S')}] {self._log_prefix} {message}", file=sys.stderr)
         else:
-            print(f"[{self.__class__.__name__}] {message}", file=sys.stderr)
+            print(f"{self._log_prefix} {message}", file=sys.stderr)
 
     def log_error(self, message: str):
         """Log error message to stderr with timestamp in CI environments."""
-        if os.environ.get("CI") or os.environ.get("GITHUB_ACTIONS"):
-            timestamp = datetime.now().strftime("%H:%M:%S")
+        if self._ci:
             print(
-                f"[{timestamp}] [{self.__class__.__name__}] ERROR: {message}",
+                f"[{time.strftime('%H:%M:%S')}] {self._log_prefix} ERROR: {message}",
                 file=sys.stderr,
             )
         else:
-            print(f"[{self.__class__.__name__}] ERROR: {message}", file=sys.stderr)
+            print(f"{self._log_prefix} ERROR: {message}", file=sys.stderr)
+
+    @classmethod
+    def with_iso_timestamps(cls, data: Any) -> Any:
+        """Return a copy of ``data`` with ``*_ns`` stamps rendered as ISO strings.
+
+        CI results record raw ``time.time_ns()`` values and defer formatting
+        to serialization time, e.g. ``json.dumps(cls.with_iso_timestamps(r))``.
+        """
+        if isinstance(data, dict):
+            rendered = {}
+            for key, value in data.items():
+                if key.endswith("_ns") and isinstance(value, int):
+                    rendered[key[:-3]] = _to_iso(value)
+                else:
+                    rendered[key] = cls.with_iso_timestamps(value)
+            return rendered
+        if isinstance(data, list):
+            return [cls.with_iso_timestamps(item) for item in data]
+        return data
 
     def get_execution_time(self) -> float:
-        """Get execution time in seconds."""
-        return (datetime.now() - self.start_time).total_seconds()
+        """Get execution time in seconds (monotonic, immune to clock changes)."""
+        return time.perf_counter() - self._start_perf
 
     @abstractmethod
     def execute(self) -> Dict[str, Any]:
@@ -183,9 +643,45 @@ class CopilotCommandBase(ABC):
             # No file saving - error logged to stderr
             return 1
 
+    def _find_ci_script(self, script_path: str) -> Optional[str]:
+        """Resolve the CI replica script once per working directory.
+
+        Walks up from the cwd looking for ``script_path``, then falls back to
+        PATH. Successful lookups are cached on the class.
+
+        Args:
+            script_path: Script name or path
+
+        Returns:
+            Absolute path to the script, or None if not found
+        """
+        cwd = os.getcwd()
+        key = (cwd, script_path)
+        cached = self._ci_script_cache.get(key)
+        if cached:
+            return cached
+
+        start = Path(cwd)
+        resolved = None
+        for directory in (start, *start.parents):
+            candidate = directory / script_path
+            if candidate.is_file():
+                resolved = str(candidate)
+                break
+        else:
+            resolved = shutil.which(script_path)
+
+        if resolved:
+            self._ci_script_cache[key] = resolved
+        return resolved
+
     def run_ci_replica(self, script_path: str = "run_ci_replica.sh") -> Dict[str, Any]:
         """Run local CI replica and capture results.
 
+        Output is streamed line by line: test counts are extracted on the fly
+        and only the last CI_OUTPUT_TAIL_LINES lines (stdout and stderr
+        combined) are kept for context.
+
         Args:
             script_path: Path to CI replica script
 
@@ -195,58 +691,75 @@ class CopilotCommandBase(ABC):
         self.log(f"Running local CI replica: {script_path}")
 
         try:
-            # Try different locations for the script
-            script_locations = [
-                script_path,
-                f"./{script_path}",
-                f"../../{script_path}",
-                f"../../../{script_path}",
-                f"/home/jleechan/projects/worldarchitect.ai/worktree_human2/{script_path}",
-            ]
-
-            result = None
-            for location in script_locations:
-                if os.path.exists(location):
-                    result = subprocess.run(
-                        [location],
-                        capture_output=True,
-                        text=True,
-                        timeout=300,  # 5 minute timeout
-                    )
-                    break
-
-            if result is None:
+            location = self._find_ci_script(script_path)
+            if location is None:
                 raise FileNotFoundError(
                     f"CI replica script not found in any location: {script_path}"
                 )
 
+            proc = subprocess.Popen(
+                [location],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1,
+                start_new_session=True,
+            )
+            timed_out = threading.Event()
+
+            def _kill():
+                # Kill the whole process group so grandchildren holding the
+                # pipe open don't keep the read loop alive past the timeout
+                timed_out.set()
+                try:
+                    os.killpg(proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+
+            watchdog = threading.Timer(CI_REPLICA_TIMEOUT, _kill)
+            watchdog.start()
+            tail = deque(maxlen=CI_OUTPUT_TAIL_LINES)
+            test_results = dict.fromkeys(_TEST_RESULT_KEYS.values(), 0)
+            seen = set()
+            try:
+                with proc.stdout:
+                    for line in proc.stdout:
+                        tail.append(line)
+                        _scan_test_results(line, test_results, seen)
+                returncode = proc.wait()
+            finally:
+                watchdog.cancel()
+
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired([location], CI_REPLICA_TIMEOUT)
+
             return {
-                "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "returncode": result.returncode,
-                "executed_at": datetime.now().isoformat(),
+                "success": returncode == 0,
+                "stdout": "".join(tail),
+                "test_results": test_results,
+                "returncode": returncode,
+                "executed_at_ns": time.time_ns(),
             }
         except subprocess.TimeoutExpired:
             self.log_error("CI replica timed out after 5 minutes")
             return {
                 "success": False,
                 "error": "Timeout after 5 minutes",
-                "executed_at": datetime.now().isoformat(),
+                "executed_at_ns": time.time_ns(),
             }
         except FileNotFoundError:
             self.log_error(f"CI replica script not found: {script_path}")
             return {
                 "success": False,
                 "error": f"Script not found: {script_path}",
-                "executed_at": datetime.now().isoformat(),
+                "executed_at_ns": time.time_ns(),
             }
         except Exception as e:
             self.log_error(f"CI replica failed: {e}")
             return {
                 "success": False,
                 "error": str(e),
-                "executed_at": datetime.now().isoformat(),
+                "executed_at_ns": time.time_ns(),
             }
 
     def compare_ci_results(
@@ -262,7 +775,7 @@ class CopilotCommandBase(ABC):
             Comparison dict with discrepancies highlighted
         """
         comparison = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp_ns": time.time_ns(),
             "match": github_ci.get("success") == local_ci.get("success"),
             "github_ci": github_ci,
             "local_ci": local_ci,
@@ -280,8 +793,13 @@ class CopilotCommandBase(ABC):
             )
 
         # Extract test results if available
-        github_tests = self._extract_test_results(github_ci.get("stdout", ""))
-        local_tests = self._extract_test_results(local_ci.get("stdout", ""))
+        # Streamed replica runs carry pre-extracted counts; raw output otherwise
+        github_tests = github_ci.get("test_results") or self._extract_test_results(
+            github_ci.get("stdout", "")
+        )
+        local_tests = local_ci.get("test_results") or self._extract_test_results(
+            local_ci.get("stdout", "")
+        )
 
         if github_tests != local_tests:
             comparison["discrepancies"].append(
@@ -303,24 +821,9 @@ class CopilotCommandBase(ABC):
         Returns:
             Dict with test counts
         """
-        import re
-
-        # Common test result patterns
-        patterns = {
-            "passed": r"(\d+) passed",
-            "failed": r"(\d+) failed",
-            "skipped": r"(\d+) skipped",
-            "errors": r"(\d+) error",
-        }
-
-        results = {}
-        for key, pattern in patterns.items():
-            match = re.search(pattern, output, re.IGNORECASE)
-            if match:
-                results[key] = int(match.group(1))
-            else:
-                results[key] = 0
-
+        # Single pass over the output; the first count seen for each kind wins
+        results = dict.fromkeys(_TEST_RESULT_KEYS.values(), 0)
+        _scan_test_results(output, results, set())
         return results
 
 
@@ -356,8 +859,37 @@ class VerificationMixin:
                 return True
 
             if attempt < max_attempts:
-                wait_time = backoff_base * attempt
-                time.sleep(wait_time)
+                time.sleep(backoff_base * 2 ** (attempt - 1))
+
+        self.log_error(f"❌ Verification failed after {max_attempts} attempts")
+        return False
+
+    async def averify_with_retry(
+        self, verify_func, expected_result, max_attempts: int = 3, backoff_base: int = 5
+    ) -> bool:
+        """Async variant of verify_with_retry that doesn't block the event loop.
+
+        Lets many verifications wait on GitHub concurrently, e.g. via
+        ``asyncio.gather``.
+
+        Args:
+            verify_func: Sync function or coroutine function returning current state
+            expected_result: Expected result to compare against
+            max_attempts: Maximum retry attempts
+            backoff_base: Base seconds for exponential backoff
+
+        Returns:
+            True if verification succeeds, False otherwise
+        """
+        is_async = inspect.iscoroutinefunction(verify_func)
+        for attempt in range(1, max_attempts + 1):
+            current = await verify_func() if is_async else verify_func()
+            if current == expected_result:
+                self.log(f"✅ Verification passed (attempt {attempt})")
+                return True
+
+            if attempt < max_attempts:
+                await asyncio.sleep(backoff_base * 2 ** (attempt - 1))
 
         self.log_error(f"❌ Verification failed after {max_attempts} attempts")
         return False
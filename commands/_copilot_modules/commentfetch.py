@@ -11,16 +11,74 @@ Extracts comments from all sources:
 Based on copilot_comment_fetch.py from PR #796 but adapted for modular architecture.
 """
 
+import asyncio
+import heapq
 import json
 import os
 import subprocess
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to the stdlib encoder
+    orjson = None
 
 from base import CopilotCommandBase
+from gh_http import enable_disk_cache
+from utils import IO_POOL, GitHubAPI
+
+
+def _dump_json(data: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, via orjson when installed.
+
+    Args:
+        data: JSON-serializable data
+        indent: Pretty-print with 2-space indentation (for files humans read)
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode()
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+# Check status -> summary bucket. Failure-like outcomes fail, queue/progress
+# states are pending, and only SUCCESS (and NEUTRAL/SKIPPED) count as passing
+_STATUS_BUCKET = {
+    **dict.fromkeys(
+        ("FAILURE", "FAILED", "CANCELLED", "TIMED_OUT", "ACTION_REQUIRED", "ERROR", "STALE"),
+        "failing",
+    ),
+    **dict.fromkeys(("PENDING", "IN_PROGRESS", "QUEUED", "REQUESTED", "WAITING"), "pending"),
+    **dict.fromkeys(("SUCCESS", "NEUTRAL", "SKIPPED"), "passing"),
+}
+
+
+def _utc_now() -> str:
+    """Current UTC time as ISO-8601 with second precision."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _created_at(comment: Dict[str, Any]) -> str:
+    """Sort key: ISO-8601 creation time (sorts lexicographically)."""
+    return comment.get("created_at", "")
+
+
+def _newest_first(batch: List[Dict[str, Any]], oldest_first: bool) -> List[Dict[str, Any]]:
+    """Order one comment source most recent first for the k-way merge.
+
+    Args:
+        batch: Standardized comments from a single source
+        oldest_first: The API already returned the batch in ascending
+            creation order, so reversing it is enough
+    """
+    if oldest_first:
+        return batch[::-1]
+    return sorted(batch, key=_created_at, reverse=True)
 
 
 class CommentFetch(CopilotCommandBase):
@@ -34,168 +92,177 @@ class CommentFetch(CopilotCommandBase):
         """
         super().__init__(pr_number)
         self.comments = []
+        # Raw inline comments, reused to classify Copilot comments locally
+        self._raw_inline: List[Dict[str, Any]] = []
 
-        # Get current branch for file path
-        try:
-            result = subprocess.run(['git', 'branch', '--show-current'],
-                                  capture_output=True, text=True, check=True)
-            branch_name = result.stdout.strip()
-            # Sanitize branch name for filesystem safety
-            self.branch_name = self._sanitize_branch_name(branch_name) if branch_name else "unknown-branch"
-        except subprocess.CalledProcessError:
-            # Use consistent fallback with base class
-            self.branch_name = "unknown-branch"
+        # Branch for the file path - the base class already resolved and
+        # sanitized it (cached per process, "unknown-branch" on failure)
+        self.branch_name = self.current_branch
 
         # Set output file path using sanitized branch name
         self.output_file = Path(f"/tmp/{self.branch_name}/comments.json")
 
-    def _get_inline_comments(self) -> List[Dict[str, Any]]:
-        """Fetch inline code review comments."""
-        self.log("Fetching inline PR comments...")
-
-        comments = []
-        # Fetch all comments with pagination
-        cmd = [
-            "gh",
-            "api",
-            f"repos/{self.repo}/pulls/{self.pr_number}/comments",
-            "--paginate",
-        ]
+        # Persist ETags next to the output so unchanged endpoints revalidate
+        # with a 304 on the next run (every request still hits GitHub)
+        enable_disk_cache(self.output_file.parent / "ghcache")
 
-        page_comments = self.run_gh_command(cmd)
-        if isinstance(page_comments, list):
-            comments.extend(page_comments)
+    def _get_inline_comments(
+        self, comments: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch inline code review comments.
 
-        # Standardize format
-        standardized = []
-        for comment in comments:
-            standardized.append(
-                {
-                    "id": comment.get("id"),
-                    "type": "inline",
-                    "body": comment.get("body", ""),
-                    "author": comment.get("user", {}).get("login", "unknown"),
-                    "created_at": comment.get("created_at", ""),
-                    "file": comment.get("path"),
-                    "line": comment.get("line") or comment.get("original_line"),
-                    "position": comment.get("position"),
-                    "in_reply_to_id": comment.get("in_reply_to_id"),
-                    "requires_response": self._requires_response(comment),
-                }
+        Args:
+            comments: Raw comments already fetched (e.g. by fetch_pr_bundle)
+        """
+        if comments is None:
+            self.log("Fetching inline PR comments...")
+            comments = []
+            # Fetch all comments with pagination
+            page_comments = self.gh_get(
+                f"repos/{self.repo}/pulls/{self.pr_number}/comments", paginate=True
             )
+            if isinstance(page_comments, list):
+                comments.extend(page_comments)
+        self._raw_inline = comments
 
-        return standardized
-
-    def _get_general_comments(self) -> List[Dict[str, Any]]:
-        """Fetch general PR comments (issue comments)."""
-        self.log("Fetching general PR comments...")
-
-        cmd = [
-            "gh",
-            "api",
-            f"repos/{self.repo}/issues/{self.pr_number}/comments",
-            "--paginate",
+        # Standardize format
+        return [
+            {
+                "id": comment.get("id"),
+                "type": "inline",
+                "body": comment.get("body", ""),
+                "author": (comment.get("user") or {}).get("login", "unknown"),
+                "created_at": comment.get("created_at", ""),
+                "file": comment.get("path"),
+                "line": comment.get("line") or comment.get("original_line"),
+                "position": comment.get("position"),
+                "in_reply_to_id": comment.get("in_reply_to_id"),
+                "requires_response": self._requires_response(comment),
+            }
+            for comment in comments
         ]
 
-        comments = self.run_gh_command(cmd)
+    def _get_general_comments(
+        self, comments: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch general PR comments (issue comments).
+
+        Args:
+            comments: Raw comments already fetched (e.g. by fetch_pr_bundle)
+        """
+        if comments is None:
+            self.log("Fetching general PR comments...")
+            comments = self.gh_get(
+                f"repos/{self.repo}/issues/{self.pr_number}/comments", paginate=True
+            )
         if not isinstance(comments, list):
             return []
 
         # Standardize format
-        standardized = []
-        for comment in comments:
-            standardized.append(
-                {
-                    "id": comment.get("id"),
-                    "type": "general",
-                    "body": comment.get("body", ""),
-                    "author": comment.get("user", {}).get("login", "unknown"),
-                    "created_at": comment.get("created_at", ""),
-                    "requires_response": self._requires_response(comment),
-                }
-            )
-
-        return standardized
-
-    def _get_review_comments(self) -> List[Dict[str, Any]]:
-        """Fetch PR review comments."""
-        self.log("Fetching PR reviews...")
-
-        cmd = [
-            "gh",
-            "api",
-            f"repos/{self.repo}/pulls/{self.pr_number}/reviews",
-            "--paginate",
+        return [
+            {
+                "id": comment.get("id"),
+                "type": "general",
+                "body": comment.get("body", ""),
+                "author": (comment.get("user") or {}).get("login", "unknown"),
+                "created_at": comment.get("created_at", ""),
+                "requires_response": self._requires_response(comment),
+            }
+            for comment in comments
         ]
 
-        reviews = self.run_gh_command(cmd)
+    def _get_review_comments(
+        self, reviews: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch PR review comments.
+
+        Args:
+            reviews: Raw reviews already fetched (e.g. by fetch_pr_bundle)
+        """
+        if reviews is None:
+            self.log("Fetching PR reviews...")
+            reviews = self.gh_get(
+                f"repos/{self.repo}/pulls/{self.pr_number}/reviews", paginate=True
+            )
         if not isinstance(reviews, list):
             return []
 
         # Extract review body comments
-        standardized = []
-        for review in reviews:
-            if review.get("body"):
-                standardized.append(
-                    {
-                        "id": review.get("id"),
-                        "type": "review",
-                        "body": review.get("body", ""),
-                        "author": review.get("user", {}).get("login", "unknown"),
-                        "created_at": review.get("submitted_at", ""),
-                        "state": review.get("state"),
-                        "requires_response": self._requires_response(review),
-                    }
-                )
-
-        return standardized
-
-    def _get_copilot_comments(self) -> List[Dict[str, Any]]:
-        """Fetch Copilot suppressed comments if available."""
+        return [
+            {
+                "id": review.get("id"),
+                "type": "review",
+                "body": review.get("body", ""),
+                "author": (review.get("user") or {}).get("login", "unknown"),
+                "created_at": review.get("submitted_at", ""),
+                "state": review.get("state"),
+                "requires_response": self._requires_response(review),
+            }
+            for review in reviews
+            if review.get("body")
+        ]
+
+    @staticmethod
+    def _is_copilot_comment(comment: Dict[str, Any]) -> bool:
+        """Match bot-authored comments mentioning copilot (same rule as the old jq filter)."""
+        user = comment.get("user") or {}
+        is_bot = (
+            user.get("login") == "github-advanced-security[bot]"
+            or user.get("type") == "Bot"
+        )
+        return is_bot and "copilot" in (comment.get("body") or "")
+
+    def _get_copilot_comments(
+        self, raw_inline: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch Copilot suppressed comments if available.
+
+        Copilot comments live on the same endpoint as inline comments, so when
+        the raw inline comments are passed in they are classified locally
+        instead of re-fetching the endpoint.
+
+        Args:
+            raw_inline: Raw inline comments already fetched by _get_inline_comments
+        """
         self.log("Checking for Copilot comments...")
 
-        # Try to get Copilot-specific comments using jq filtering
-        cmd = [
-            "gh",
-            "api",
-            f"repos/{self.repo}/pulls/{self.pr_number}/comments",
-            "--jq",
-            '.[] | select(.user.login == "github-advanced-security[bot]" or .user.type == "Bot") | select(.body | contains("copilot"))',
-        ]
+        if raw_inline is not None:
+            comments = [c for c in raw_inline if self._is_copilot_comment(c)]
+        else:
+            # Standalone use: fetch and filter with jq
+            cmd = [
+                "gh",
+                "api",
+                f"repos/{self.repo}/pulls/{self.pr_number}/comments",
+                "--jq",
+                '[.[] | select(.user.login == "github-advanced-security[bot]" or .user.type == "Bot") | select(.body | contains("copilot"))]',
+            ]
 
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            if result.returncode == 0 and result.stdout.strip():
-                # Parse JSONL output
-                comments = []
-                for line in result.stdout.strip().split("\n"):
-                    try:
-                        comments.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        pass
-
-                # Standardize format
-                standardized = []
-                for comment in comments:
-                    standardized.append(
-                        {
-                            "id": comment.get("id"),
-                            "type": "copilot",
-                            "body": comment.get("body", ""),
-                            "author": "copilot",
-                            "created_at": comment.get("created_at", ""),
-                            "file": comment.get("path"),
-                            "line": comment.get("line"),
-                            "suppressed": True,
-                            "requires_response": True,  # Copilot comments usually need attention
-                        }
-                    )
-
-                return standardized
-        except Exception as e:
-            self.log(f"Could not fetch Copilot comments: {e}")
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True)
+                if result.returncode != 0 or not result.stdout.strip():
+                    return []
+                # The filter is wrapped in [...] so stdout is one JSON array
+                comments = json.loads(result.stdout)
+            except Exception as e:
+                self.log(f"Could not fetch Copilot comments: {e}")
+                return []
 
-        return []
+        # Standardize format
+        return [
+            {
+                "id": comment.get("id"),
+                "type": "copilot",
+                "body": comment.get("body", ""),
+                "author": "copilot",
+                "created_at": comment.get("created_at", ""),
+                "file": comment.get("path"),
+                "line": comment.get("line"),
+                "suppressed": True,
+                "requires_response": True,  # Copilot comments usually need attention
+            }
+            for comment in comments
+        ]
 
     def _requires_response(self, comment: Dict[str, Any]) -> bool:
         """Include all comments for Claude to analyze.
@@ -212,90 +279,27 @@ class CommentFetch(CopilotCommandBase):
         # No pattern matching, no keyword detection
         return True
 
-    def _get_ci_status(self) -> Dict[str, Any]:
+    def _get_ci_status(self, fetched_at: Optional[str] = None) -> Dict[str, Any]:
         """Fetch GitHub CI status using /fixpr methodology.
         
         Uses GitHub as authoritative source for CI status.
         Implements defensive programming patterns from /fixpr.
         
+        Args:
+            fetched_at: Timestamp to record (defaults to now, UTC)
+
         Returns:
             Dict with CI status information
         """
         try:
             # Use /fixpr methodology: GitHub is authoritative source
-            cmd = [
-                'gh', 'pr', 'view', self.pr_number, 
-                '--json', 'statusCheckRollup,mergeable,mergeStateStatus'
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            pr_data = json.loads(result.stdout)
-            
-            # Defensive programming: statusCheckRollup is often a LIST
-            status_checks = pr_data.get('statusCheckRollup', [])
-            if not isinstance(status_checks, list):
-                status_checks = [status_checks] if status_checks else []
-            
-            # Process checks with safe access patterns from /fixpr
-            checks = []
-            failing_checks = []
-            pending_checks = []
-            passing_checks = []
-            
-            for check in status_checks:
-                if not isinstance(check, dict):
-                    continue
-                    
-                # Prefer conclusion (for completed check runs). Fall back to state (contexts), then UNKNOWN.
-                status_value = (check.get('conclusion') or check.get('state') or 'UNKNOWN')
-                check_info = {
-                    'name': check.get('name', check.get('context', 'unknown')),
-                    'status': status_value,
-                    'description': check.get('description', ''),
-                    'url': check.get('detailsUrl', ''),
-                    'started_at': check.get('startedAt', ''),
-                    'completed_at': check.get('completedAt', '')
-                }
-                checks.append(check_info)
-                
-                # Categorize for quick analysis with safe status normalization
-                status_upper = (status_value or 'UNKNOWN').upper()
-                # Treat failure-like outcomes as failing
-                if status_upper in ['FAILURE', 'FAILED', 'CANCELLED', 'TIMED_OUT', 'ACTION_REQUIRED', 'ERROR', 'STALE']:
-                    failing_checks.append(check_info)
-                # Queue/progress states are pending
-                elif status_upper in ['PENDING', 'IN_PROGRESS', 'QUEUED', 'REQUESTED', 'WAITING']:
-                    pending_checks.append(check_info)
-                # Only SUCCESS (and optionally NEUTRAL/SKIPPED) should count as passing
-                elif status_upper in ['SUCCESS', 'NEUTRAL', 'SKIPPED']:
-                    passing_checks.append(check_info)
-            
-            # Overall CI state assessment
-            overall_state = 'UNKNOWN'
-            if failing_checks:
-                overall_state = 'FAILING'
-            elif pending_checks:
-                overall_state = 'PENDING'
-            elif passing_checks and not failing_checks and not pending_checks:
-                overall_state = 'PASSING'
-            
-            return {
-                'overall_state': overall_state,
-                'mergeable': pr_data.get('mergeable', None),
-                'merge_state_status': pr_data.get('mergeStateStatus', 'unknown'),
-                'checks': checks,
-                'summary': {
-                    'total': len(checks),
-                    'passing': len(passing_checks),
-                    'failing': len(failing_checks),
-                    'pending': len(pending_checks)
-                },
-                'failing_checks': failing_checks,
-                'pending_checks': pending_checks,
-                'fetched_at': datetime.now().isoformat()
-            }
+            pr_data = GitHubAPI.pr_view(
+                self.repo, self.pr_number,
+                ['statusCheckRollup', 'mergeable', 'mergeStateStatus']
+            )
+            return self._summarize_ci_status(pr_data, fetched_at or _utc_now())
             
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, OSError) as e:
             self.log(f"Error fetching CI status: {e}")
             return {
                 'overall_state': 'ERROR',
@@ -320,70 +324,176 @@ class CommentFetch(CopilotCommandBase):
                 'summary': {'total': 0, 'passing': 0, 'failing': 0, 'pending': 0}
             }
 
+    def _summarize_ci_status(self, pr_data: Dict[str, Any], fetched_at: str) -> Dict[str, Any]:
+        """Categorize checks from `gh pr view --json statusCheckRollup,...` shaped data.
+
+        Args:
+            pr_data: Dict with statusCheckRollup, mergeable and mergeStateStatus
+            fetched_at: Timestamp to record with the status
+
+        Returns:
+            Dict with CI status information
+        """
+        # Defensive programming: statusCheckRollup is often a LIST
+        status_checks = pr_data.get('statusCheckRollup', [])
+        if not isinstance(status_checks, list):
+            status_checks = [status_checks] if status_checks else []
+        
+        # Process checks with safe access patterns from /fixpr
+        checks = []
+        buckets = {"failing": [], "pending": [], "passing": []}
+        
+        for check in status_checks:
+            if not isinstance(check, dict):
+                continue
+                
+            # Prefer conclusion (for completed check runs). Fall back to state (contexts), then UNKNOWN.
+            status_value = (check.get('conclusion') or check.get('state') or 'UNKNOWN')
+            check_info = {
+                'name': check.get('name', check.get('context', 'unknown')),
+                'status': status_value,
+                'description': check.get('description', ''),
+                'url': check.get('detailsUrl', ''),
+                'started_at': check.get('startedAt', ''),
+                'completed_at': check.get('completedAt', '')
+            }
+            checks.append(check_info)
+            
+            # Categorize for quick analysis with safe status normalization
+            bucket = _STATUS_BUCKET.get((status_value or 'UNKNOWN').upper())
+            if bucket:
+                buckets[bucket].append(check_info)
+
+        failing_checks = buckets["failing"]
+        pending_checks = buckets["pending"]
+        passing_checks = buckets["passing"]
+        
+        # Overall CI state assessment
+        overall_state = 'UNKNOWN'
+        if failing_checks:
+            overall_state = 'FAILING'
+        elif pending_checks:
+            overall_state = 'PENDING'
+        elif passing_checks and not failing_checks and not pending_checks:
+            overall_state = 'PASSING'
+        
+        return {
+            'overall_state': overall_state,
+            'mergeable': pr_data.get('mergeable', None),
+            'merge_state_status': pr_data.get('mergeStateStatus', 'unknown'),
+            'checks': checks,
+            'summary': {
+                'total': len(checks),
+                'passing': len(passing_checks),
+                'failing': len(failing_checks),
+                'pending': len(pending_checks)
+            },
+            'failing_checks': failing_checks,
+            'pending_checks': pending_checks,
+            'fetched_at': fetched_at
+        }
+
+    async def _fetch_rest(self, fetched_at: str) -> List[Tuple[str, Any]]:
+        """Run the REST fallback fetches concurrently on the shared I/O pool.
+
+        Args:
+            fetched_at: Timestamp recorded with the CI status
+
+        Returns:
+            (data_type, result or raised exception) pairs in a fixed order
+        """
+        loop = asyncio.get_running_loop()
+        jobs = {
+            "inline": (self._get_inline_comments,),
+            "general": (self._get_general_comments,),
+            "review": (self._get_review_comments,),
+            "ci_status": (self._get_ci_status, fetched_at),
+        }
+        results = await asyncio.gather(
+            *(loop.run_in_executor(IO_POOL, *job) for job in jobs.values()),
+            return_exceptions=True,
+        )
+        return list(zip(jobs, results))
+
     def execute(self) -> Dict[str, Any]:
         """Execute comment fetching from all sources."""
         self.log(f"🔄 FETCHING FRESH COMMENTS for PR #{self.pr_number} from GitHub API")
         self.log(f"⚠️ NEVER reading from cache - always fresh API calls")
         self.log(f"📁 Will save to: {self.output_file}")
 
-        # Fetch comments and CI status in parallel for speed
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {
-                executor.submit(self._get_inline_comments): "inline",
-                executor.submit(self._get_general_comments): "general",
-                executor.submit(self._get_review_comments): "review",
-                executor.submit(self._get_copilot_comments): "copilot",
-                executor.submit(self._get_ci_status): "ci_status",
-            }
-            
-            ci_status = None
-
-            for future in as_completed(futures):
-                data_type = futures[future]
-                try:
-                    result = future.result()
-                    if data_type == "ci_status":
-                        ci_status = result
-                        self.log(f"  Fetched CI status: {result.get('overall_state', 'unknown')}")
-                    else:
-                        # This is comment data
-                        self.comments.extend(result)
-                        self.log(f"  Found {len(result)} {data_type} comments")
-                except Exception as e:
+        # One timestamp for the whole run, shared by the CI status
+        fetched_at = _utc_now()
+        ci_status = None
+        # One newest-first list per source, k-way merged at the end
+        batches: List[List[Dict[str, Any]]] = []
+
+        # One GraphQL query returns comments, reviews, review threads and
+        # checks together; fall back to parallel REST calls if it fails
+        bundle = self.fetch_pr_bundle()
+        if bundle:
+            self.log("  Fetched comments and CI status in one GraphQL query")
+            # Issue comments come back in creation order; review-thread
+            # comments are grouped by thread and reviews are keyed on
+            # submission time, so those two need a real sort
+            for data_type, standardize, raw, oldest_first in (
+                ("inline", self._get_inline_comments, bundle["inline"], False),
+                ("general", self._get_general_comments, bundle["general"], True),
+                ("review", self._get_review_comments, bundle["reviews"], False),
+            ):
+                result = standardize(raw)
+                batches.append(_newest_first(result, oldest_first))
+                self.log(f"  Found {len(result)} {data_type} comments")
+            inline_oldest_first = False
+            ci_status = self._summarize_ci_status({
+                'statusCheckRollup': bundle["status_checks"],
+                'mergeable': bundle["mergeable"],
+                'mergeStateStatus': bundle["merge_state_status"],
+            }, fetched_at)
+            self.log(f"  Fetched CI status: {ci_status['overall_state']}")
+        else:
+            # Fetch comments and CI status concurrently on the shared pool
+            for data_type, result in asyncio.run(self._fetch_rest(fetched_at)):
+                if isinstance(result, Exception):
                     if data_type == "ci_status":
-                        self.log_error(f"Failed to fetch CI status: {e}")
-                        ci_status = {'overall_state': 'ERROR', 'error': str(e)}
+                        self.log_error(f"Failed to fetch CI status: {result}")
+                        ci_status = {'overall_state': 'ERROR', 'error': str(result)}
                     else:
-                        self.log_error(f"Failed to fetch {data_type} comments: {e}")
-
-        # Sort by created_at (most recent first)
-        self.comments.sort(key=lambda c: c.get("created_at", ""), reverse=True)
+                        self.log_error(f"Failed to fetch {data_type} comments: {result}")
+                elif data_type == "ci_status":
+                    ci_status = result
+                    self.log(f"  Fetched CI status: {result.get('overall_state', 'unknown')}")
+                else:
+                    # This is comment data; the REST comment endpoints list
+                    # in creation order, reviews are keyed on submission time
+                    batches.append(_newest_first(result, data_type != "review"))
+                    self.log(f"  Found {len(result)} {data_type} comments")
+            inline_oldest_first = True
+
+        # Copilot comments come from the inline payload - no second round-trip
+        copilot = self._get_copilot_comments(self._raw_inline)
+        batches.append(_newest_first(copilot, inline_oldest_first))
+        self.log(f"  Found {len(copilot)} copilot comments")
+
+        # Sort by created_at (most recent first) by merging the per-source
+        # lists instead of re-sorting the combined list
+        self.comments.extend(heapq.merge(*batches, key=_created_at, reverse=True))
 
         # Count comments needing responses
         # After filtering, all remaining comments are unresponded
         unresponded_count = len(self.comments)
+        type_counts = Counter(c["type"] for c in self.comments)
 
         # Prepare data to save
         data = {
             "pr": self.pr_number,
-            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "fetched_at": fetched_at,
             "comments": self.comments,
             "ci_status": ci_status or {'overall_state': 'UNKNOWN', 'error': 'CI status not fetched'},
             "metadata": {
                 "total": len(self.comments),
                 "by_type": {
-                    "inline": len(
-                        [c for c in self.comments if c["type"] == "inline"]
-                    ),
-                    "general": len(
-                        [c for c in self.comments if c["type"] == "general"]
-                    ),
-                    "review": len(
-                        [c for c in self.comments if c["type"] == "review"]
-                    ),
-                    "copilot": len(
-                        [c for c in self.comments if c["type"] == "copilot"]
-                    ),
+                    comment_type: type_counts.get(comment_type, 0)
+                    for comment_type in ("inline", "general", "review", "copilot")
                 },
                 "unresponded_count": unresponded_count,
                 "repo": self.repo,
@@ -393,9 +503,18 @@ class CommentFetch(CopilotCommandBase):
         # Create directory if it doesn't exist
         self.output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Save to file (always replace)
-        with open(self.output_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        # Save to file (always replace). Write a sibling temp file and rename
+        # it over the target so readers never see a truncated comments.json
+        tmp_file = self.output_file.with_suffix(f".json.{os.getpid()}.tmp")
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(_dump_json(data, indent=True))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.output_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
 
         self.log(f"Comments saved to {self.output_file}")
 
@@ -438,11 +557,11 @@ def main():
         result = fetcher.execute()
         result["execution_time"] = fetcher.get_execution_time()
 
-        # Output JSON data to stdout as documented
-        print(json.dumps(result["data"], indent=2))
+        # Output JSON data to stdout as documented (compact - consumed by tools)
+        sys.stdout.buffer.write(_dump_json(result["data"]) + b"\n")
+        sys.stdout.flush()
 
         # Log success to stderr so it doesn't interfere with JSON output
-        import sys
         print(f"[CommentFetch] ✅ Success: {result.get('message', 'Command completed')}", file=sys.stderr)
 
         return 0 if result.get("success") else 1
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+gh_http.py - Pooled HTTPS access to the GitHub API
+
+Provides:
+- One process-wide requests.Session with connection pooling (GH)
+- Token lookup done once (GITHUB_TOKEN / GH_TOKEN / `gh auth token`)
+- gh_get(): REST GET with --paginate semantics, falling back to the gh CLI
+  when requests or a token is unavailable
+- GitHubHTTP: ETag revalidation and a shared rate-limit governor
+"""
+
+import functools
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:  # requests is optional - commands fall back to the gh CLI
+    requests = None
+
+GITHUB_API_URL = "https://api.github.com"
+
+# Pause before a call once fewer than this many core API requests remain
+GH_RATE_LIMIT_FLOOR = int(os.environ.get("GH_RATE_LIMIT_FLOOR", "100"))
+
+# statusCheckRollup selection matching `gh pr view --json statusCheckRollup`
+STATUS_CHECK_ROLLUP_FIELDS = """
+contexts(first: 100) {
+  nodes {
+    __typename
+    ... on CheckRun { name status conclusion startedAt completedAt detailsUrl }
+    ... on StatusContext { context state description targetUrl }
+  }
+}"""
+
+# Page size for paginated REST calls, and how many pages are fetched at once
+GH_PER_PAGE = 100
+GH_PAGE_WORKERS = 8
+
+# Everything gh_get can raise: CLI failures, transport/HTTP errors
+# (requests.RequestException is an OSError) and JSON decoding errors
+GH_ERRORS = (subprocess.CalledProcessError, OSError, ValueError)
+
+
+def _build_session():
+    """Build the pooled HTTPS session shared by all commands in this process."""
+    if requests is None:
+        return None
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+    session.mount("https://", adapter)
+    session.headers.update(
+        {
+            "Accept": "application/vnd.github+json",
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+    )
+    return session
+
+
+GH = _build_session()
+
+
+@functools.lru_cache(maxsize=1)
+def github_token() -> Optional[str]:
+    """Read the GitHub token once from the environment or `gh auth token`."""
+    token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+    if token:
+        return token
+    try:
+        output = subprocess.check_output(
+            ["gh", "auth", "token"], text=True, stderr=subprocess.DEVNULL
+        )
+        return output.strip() or None
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+
+
+@dataclass
+class _RateLimit:
+    """Process-wide view of the GitHub core rate-limit budget."""
+
+    remaining: Optional[int] = None
+    reset_epoch: Optional[int] = None
+    seeded: bool = False
+
+
+class GitHubHTTP:
+    """Minimal GitHub REST/GraphQL client over the shared pooled session.
+
+    Every call passes through a shared rate-limit governor that waits for
+    the reset window instead of burning the remaining budget into 403s.
+    GET responses are cached by ETag and revalidated with ``If-None-Match``;
+    GitHub answers unchanged resources with a 304 that doesn't count against
+    the primary rate limit. Cached bodies are shared - treat them as read-only.
+    With a disk cache enabled, ETags and bodies also survive across runs;
+    entries are always revalidated, never served without a request.
+    """
+
+    # Directory for {etag, body, links} files persisted across CLI runs
+    disk_cache_dir: Optional[Path] = None
+
+    # (url, params) -> (etag, parsed body, {rel: url} Link map), LRU-ordered
+    _etag_cache: "OrderedDict[Tuple[str, Tuple], Tuple[str, Any, Dict[str, str]]]" = OrderedDict()
+    _etag_cache_size = 256
+    _etag_lock = threading.Lock()  # run_gh_batch shares the cache across threads
+
+    # Shared by every client in the process so concurrent callers see one budget
+    rate_limit = _RateLimit()
+    _rate_limit_lock = threading.Lock()
+
+    def __init__(self, session):
+        self.session = session
+
+    def _record_rate_limit(self, response) -> None:
+        """Track X-RateLimit-* headers from the latest response."""
+        if response.headers.get("X-RateLimit-Resource", "core") != "core":
+            return  # GraphQL/search budgets are separate from the core budget
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is not None:
+            self.rate_limit.remaining = int(remaining)
+        if reset is not None:
+            self.rate_limit.reset_epoch = int(reset)
+
+    def _seed_rate_limit(self) -> None:
+        """Seed the governor once per process from GET /rate_limit (free to call)."""
+        with self._rate_limit_lock:
+            if self.rate_limit.seeded:
+                return
+            self.rate_limit.seeded = True
+            try:
+                response = self.session.get(f"{GITHUB_API_URL}/rate_limit", timeout=10)
+                core = response.json().get("resources", {}).get("core", {})
+            except Exception:
+                return  # Headers from the first real response will seed it instead
+            if "remaining" in core:
+                self.rate_limit.remaining = int(core["remaining"])
+            if "reset" in core:
+                self.rate_limit.reset_epoch = int(core["reset"])
+
+    def _wait_for_budget(self) -> None:
+        """Sleep until the window resets when the remaining budget is below the floor."""
+        self._seed_rate_limit()
+        remaining, reset_epoch = self.rate_limit.remaining, self.rate_limit.reset_epoch
+        if remaining is None or reset_epoch is None or remaining >= GH_RATE_LIMIT_FLOOR:
+            return
+        delay = reset_epoch - time.time()
+        if delay > 0:
+            print(
+                f"[GitHubHTTP] Rate limit low ({remaining} left) - waiting {delay:.0f}s for reset",
+                file=sys.stderr,
+            )
+            time.sleep(delay)
+
+    @classmethod
+    def _disk_path(cls, key: Tuple[str, Tuple]) -> Optional[Path]:
+        """Cache file for a request key, or None when the disk cache is off."""
+        if cls.disk_cache_dir is None:
+            return None
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()
+        return cls.disk_cache_dir / f"{digest}.json"
+
+    @classmethod
+    def _load_disk(cls, key: Tuple[str, Tuple]) -> Optional[Tuple[str, Any, Dict[str, str]]]:
+        """Read a persisted (etag, body, links) entry if present."""
+        path = cls._disk_path(key)
+        if path is None:
+            return None
+        try:
+            with open(path) as f:
+                entry = json.load(f)
+            return entry["etag"], entry["body"], entry.get("links") or {}
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @classmethod
+    def _store_disk(cls, key: Tuple[str, Tuple], entry: Tuple[str, Any, Dict[str, str]]) -> None:
+        """Persist an entry atomically; cache write failures are not fatal."""
+        path = cls._disk_path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp, "w") as f:
+                json.dump({"etag": entry[0], "body": entry[1], "links": entry[2]}, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    def _send(self, method: str, url: str, **kwargs) -> Tuple[Any, Dict[str, str]]:
+        """Send one request through the ETag cache; returns (body, {rel: url} links)."""
+        key = (url, tuple(sorted((kwargs.get("params") or {}).items())))
+        with self._etag_lock:
+            cached = self._etag_cache.get(key) if method == "GET" else None
+        if cached is None and method == "GET":
+            cached = self._load_disk(key)
+        if cached:
+            kwargs["headers"] = {**kwargs.get("headers", {}), "If-None-Match": cached[0]}
+
+        self._wait_for_budget()
+        response = self.session.request(method, url, **kwargs)
+        self._record_rate_limit(response)
+        if cached and response.status_code == 304:
+            with self._etag_lock:
+                if key in self._etag_cache:
+                    self._etag_cache.move_to_end(key)
+            return cached[1], cached[2]
+
+        response.raise_for_status()
+        data = response.json() if response.content else {}
+        links = {rel: link["url"] for rel, link in response.links.items() if "url" in link}
+
+        entry = None
+        with self._etag_lock:
+            if method != "GET":
+                self._etag_cache.pop(key, None)
+            elif response.headers.get("ETag"):
+                entry = (response.headers["ETag"], data, links)
+                self._etag_cache[key] = entry
+                self._etag_cache.move_to_end(key)
+                while len(self._etag_cache) > self._etag_cache_size:
+                    self._etag_cache.popitem(last=False)
+        if entry is not None:
+            self._store_disk(key, entry)
+
+        return data, links
+
+    def request(self, method: str, path: str, paginate: bool = False, **kwargs) -> Any:
+        """Issue a request and return the parsed JSON body.
+
+        Args:
+            method: HTTP method
+            path: API path (``repos/...``) or absolute URL
+            paginate: Fetch every page (``per_page=100``) and merge list pages
+            **kwargs: Passed through to ``requests.Session.request``
+
+        Returns:
+            Parsed JSON response ({} for empty bodies)
+
+        Raises:
+            requests.RequestException: On transport or HTTP errors
+        """
+        url = path if path.startswith("http") else f"{GITHUB_API_URL}/{path.lstrip('/')}"
+        kwargs.setdefault("timeout", 30)
+        if paginate and "?" not in url:
+            kwargs["params"] = {"per_page": GH_PER_PAGE, **(kwargs.get("params") or {})}
+        data, links = self._send(method, url, **kwargs)
+
+        if not (paginate and isinstance(data, list) and "next" in links):
+            return data
+
+        data = list(data)  # Don't extend the cached first page in place
+        page_urls = _page_urls(links.get("last"))
+        if page_urls:
+            # Page count is known from rel="last": fetch pages 2..N concurrently
+            pages = _PAGE_POOL.map(
+                lambda page_url: self._send("GET", page_url, timeout=kwargs["timeout"])[0],
+                page_urls,
+            )
+            for page in pages:
+                data.extend(page)
+            return data
+
+        # Cursor-style pagination: no page numbers, follow rel="next" serially
+        next_url = links.get("next")
+        while next_url:
+            page, links = self._send("GET", next_url, timeout=kwargs["timeout"])
+            data.extend(page)
+            next_url = links.get("next")
+        return data
+
+
+_PAGE_POOL = ThreadPoolExecutor(max_workers=GH_PAGE_WORKERS, thread_name_prefix="gh-page")
+
+
+def _page_urls(last_url: Optional[str]) -> list:
+    """URLs for pages 2..N given a rel="last" link, or [] if it isn't page-numbered."""
+    if not last_url:
+        return []
+    parts = urlsplit(last_url)
+    query = parse_qs(parts.query)
+    try:
+        last_page = int(query["page"][0])
+    except (KeyError, ValueError):
+        return []
+    urls = []
+    for number in range(2, last_page + 1):
+        query["page"] = [str(number)]
+        urls.append(urlunsplit(parts._replace(query=urlencode(query, doseq=True))))
+    return urls
+
+
+_CLIENT: Optional[GitHubHTTP] = None
+
+
+def enable_disk_cache(directory: Path) -> None:
+    """Persist ETag-validated GET responses under ``directory`` across runs."""
+    GitHubHTTP.disk_cache_dir = Path(directory)
+
+
+def get_client() -> Optional[GitHubHTTP]:
+    """Return the shared authenticated client, or None to use the gh CLI.
+
+    The token is looked up on first call (not at import) and attached to the
+    session. Without requests or a token there is no client.
+    """
+    global _CLIENT
+    if _CLIENT is None and GH is not None:
+        token = github_token()
+        if token:
+            GH.headers["Authorization"] = f"Bearer {token}"
+            _CLIENT = GitHubHTTP(GH)
+    return _CLIENT
+
+
+def gh_get(path: str, paginate: bool = False) -> Any:
+    """GET a GitHub REST path, equivalent to `gh api <path> [--paginate]`.
+
+    Args:
+        path: API path such as ``repos/{owner}/{repo}/pulls/1/comments``
+        paginate: Follow ``Link: rel="next"`` and merge list pages
+
+    Returns:
+        Parsed JSON response ({} for empty bodies)
+
+    Raises:
+        One of GH_ERRORS on CLI, transport, HTTP or JSON errors
+    """
+    client = get_client()
+    if client is not None:
+        return client.request("GET", path, paginate=paginate)
+
+    if not paginate and GitHubHTTP.disk_cache_dir is not None:
+        return _gh_cli_get_conditional(path)
+
+    cmd = ["gh", "api", path] + (["--paginate"] if paginate else [])
+    output = subprocess.check_output(cmd, text=True, stderr=subprocess.PIPE)
+    return json.loads(output) if output.strip() else {}
+
+
+def _split_included(output: str) -> Tuple[int, Dict[str, str], str]:
+    """Split `gh api --include` output into (status, lower-cased headers, body)."""
+    head, _, body = output.replace("\r\n", "\n").partition("\n\n")
+    status_line, *header_lines = head.split("\n")
+    try:
+        status = int(status_line.split()[1])
+    except (IndexError, ValueError):
+        status = 0
+    headers = {}
+    for line in header_lines:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return status, headers, body
+
+
+def _gh_cli_get_conditional(path: str) -> Any:
+    """`gh api <path>` revalidated with If-None-Match against the disk cache.
+
+    Shares entries with GitHubHTTP (same key), so either transport can
+    revalidate what the other stored. gh exits non-zero on a 304, so the
+    status line is checked before the exit code.
+    """
+    key = (f"{GITHUB_API_URL}/{path.lstrip('/')}", ())
+    cached = GitHubHTTP._load_disk(key)
+    cmd = ["gh", "api", "--include", path]
+    if cached:
+        cmd += ["-H", f"If-None-Match: {cached[0]}"]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    status, headers, body = _split_included(result.stdout)
+    if cached and status == 304:
+        return cached[1]
+    if result.returncode != 0:
+        raise subprocess.CalledProcessError(
+            result.returncode, cmd, result.stdout, result.stderr
+        )
+
+    data = json.loads(body) if body.strip() else {}
+    if headers.get("etag"):
+        GitHubHTTP._store_disk(key, (headers["etag"], data, {}))
+    return data
+
+
+def gh_graphql(query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """POST a GraphQL query, equivalent to `gh api graphql`.
+
+    Args:
+        query: GraphQL query string
+        variables: Query variables
+
+    Returns:
+        The full response payload (``data`` and possibly ``errors``)
+
+    Raises:
+        One of GH_ERRORS on CLI, transport, HTTP or JSON errors
+    """
+    body = {"query": query, "variables": variables or {}}
+    client = get_client()
+    if client is not None:
+        return client.request("POST", "graphql", json=body)
+
+    output = subprocess.check_output(
+        ["gh", "api", "graphql", "--input", "-"],
+        input=json.dumps(body),
+        text=True,
+        stderr=subprocess.PIPE,
+    )
+    return json.loads(output)
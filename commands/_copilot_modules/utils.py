@@ -9,72 +9,183 @@ Provides common functionality for:
 - Common error messages
 """
 
+import atexit
+import functools
 import json
+import mmap
+import os
+import re
 import subprocess
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from base import _current_branch_for
+from gh_http import GH_ERRORS, STATUS_CHECK_ROLLUP_FIELDS, get_client, gh_graphql
+
+# Fields `gh pr view --json` would return, fetched over the pooled session
+PR_VIEW_QUERY = """
+query($owner: String!, $name: String!, $number: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      number
+      title
+      state
+      mergeable
+      mergeStateStatus
+      commits(last: 1) { nodes { commit { statusCheckRollup { %s } } } }
+    }
+  }
+}""" % STATUS_CHECK_ROLLUP_FIELDS
+
+# Conflict start/end markers at the beginning of a line
+_CONFLICT_MARKER_RE = re.compile(rb"^(?:<{7}|>{7})", re.MULTILINE)
+
+# Process-wide worker threads for concurrent I/O, shared by all commands so
+# repeated fetches reuse threads. Separate from gh_http's page pool, which
+# jobs submitted here may fan out into.
+IO_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="copilot-io")
+atexit.register(IO_POOL.shutdown)
 
 
 class GitHubAPI:
     """Wrapper for common GitHub API operations with caching."""
 
-    # Simple in-memory cache with 5-minute TTL
-    _cache = {}
+    # Simple in-memory cache with 5-minute TTL, keyed on (method, *args).
+    # Ages use the monotonic clock so wall-clock jumps can't extend entries.
+    _cache: Dict[Tuple, Tuple[float, Any]] = {}
     _cache_ttl = 300  # 5 minutes
 
+    # Futures for lookups currently in flight, so concurrent callers asking
+    # for the same key wait on one request instead of issuing duplicates
+    _inflight: Dict[Tuple, "Future[Dict[str, Any]]"] = {}
+    _inflight_lock = threading.Lock()
+
     @classmethod
-    def _get_cache_key(cls, method: str, *args) -> str:
-        """Generate cache key from method and arguments."""
-        return f"{method}:{':'.join(str(arg) for arg in args)}"
+    def _get_cache_key(cls, method: str, *args) -> Tuple:
+        """Generate cache key from method and arguments.
+
+        Arguments are normalized with str() so "123" and 123 share an entry.
+        """
+        return (method, *map(str, args))
 
     @classmethod
-    def _get_cached(cls, key: str) -> Optional[Dict[str, Any]]:
+    def _get_cached(cls, key: Tuple) -> Optional[Dict[str, Any]]:
         """Get cached result if not expired."""
         if key in cls._cache:
             cached_time, data = cls._cache[key]
-            if time.time() - cached_time < cls._cache_ttl:
+            if time.monotonic() - cached_time < cls._cache_ttl:
                 return data
         return None
 
     @classmethod
-    def _set_cache(cls, key: str, data: Dict[str, Any]):
+    def _set_cache(cls, key: Tuple, data: Dict[str, Any]):
         """Cache result with timestamp."""
-        cls._cache[key] = (time.time(), data)
+        cls._cache[key] = (time.monotonic(), data)
 
     @classmethod
-    def get_pr_status(cls, repo: str, pr_number: str) -> Dict[str, Any]:
-        """Get PR status including CI checks with caching.
+    def _fetch_once(
+        cls, key: Tuple, fetch: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Return the cached value for ``key`` or run ``fetch`` exactly once.
+
+        The first caller on a miss runs ``fetch``; callers arriving while it
+        is in flight block on the same Future and share its result.
+        """
+        with cls._inflight_lock:
+            cached = cls._get_cached(key)
+            if cached is not None:
+                return cached
+            future = cls._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = cls._inflight[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            data = fetch()
+            future.set_result(data)
+            return data
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with cls._inflight_lock:
+                cls._inflight.pop(key, None)
+
+    @staticmethod
+    def pr_view(repo: str, pr_number: str, fields: List[str]) -> Dict[str, Any]:
+        """Equivalent of `gh pr view --json <fields>` without forking gh.
+
+        Uses one GraphQL call over the pooled session when a token is
+        available, otherwise the GitHub CLI.
 
         Args:
             repo: Repository in format owner/name
             pr_number: PR number
+            fields: gh --json field names (number, title, state, mergeable,
+                mergeStateStatus, statusCheckRollup)
 
         Returns:
-            Dict with PR status information
-        """
-        # Check cache first
-        cache_key = cls._get_cache_key("get_pr_status", repo, pr_number)
-        cached = cls._get_cached(cache_key)
-        if cached is not None:
-            return cached
+            Dict with the requested fields
 
-        try:
+        Raises:
+            One of GH_ERRORS on CLI, transport, HTTP or JSON errors
+        """
+        if get_client() is None:
             cmd = [
                 "gh",
                 "pr",
                 "view",
-                pr_number,
+                str(pr_number),
                 "--repo",
                 repo,
                 "--json",
-                "state,mergeable,statusCheckRollup,number,title",
+                ",".join(fields),
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            data = json.loads(result.stdout)
-            cls._set_cache(cache_key, data)
-            return data
-        except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
-            return {"error": str(e)}
+            return json.loads(
+                subprocess.check_output(cmd, text=True, stderr=subprocess.PIPE)
+            )
+
+        owner, _, name = repo.partition("/")
+        payload = gh_graphql(
+            PR_VIEW_QUERY, {"owner": owner, "name": name, "number": int(pr_number)}
+        )
+        pr = ((payload.get("data") or {}).get("repository") or {}).get("pullRequest")
+        if not pr:
+            raise ValueError(f"PR #{pr_number} not found: {payload.get('errors')}")
+        commits = (pr.get("commits") or {}).get("nodes") or []
+        rollup = (commits[-1]["commit"].get("statusCheckRollup") or {}) if commits else {}
+        pr["statusCheckRollup"] = (rollup.get("contexts") or {}).get("nodes") or []
+        return {field: pr.get(field) for field in fields}
+
+    @classmethod
+    def get_pr_status(cls, repo: str, pr_number: str) -> Dict[str, Any]:
+        """Get PR status including CI checks with caching.
+
+        Args:
+            repo: Repository in format owner/name
+            pr_number: PR number
+
+        Returns:
+            Dict with PR status information
+        """
+        cache_key = cls._get_cache_key("get_pr_status", repo, pr_number)
+
+        def fetch() -> Dict[str, Any]:
+            try:
+                data = cls.pr_view(
+                    repo, pr_number, ["state", "mergeable", "statusCheckRollup", "number", "title"]
+                )
+                cls._set_cache(cache_key, data)
+                return data
+            except GH_ERRORS as e:
+                return {"error": str(e)}
+
+        # Check cache first; concurrent misses share one in-flight request
+        return cls._fetch_once(cache_key, fetch)
 
     @staticmethod
     def get_ci_checks(repo: str, pr_number: str) -> List[Dict[str, Any]]:
@@ -88,6 +199,11 @@ class GitHubAPI:
             List of CI check results
         """
         try:
+            if get_client() is not None:
+                # The rollup already carries per-check detail - no extra call
+                checks = GitHubAPI.get_pr_status(repo, pr_number).get("statusCheckRollup", [])
+                return checks if isinstance(checks, list) else []
+
             # First try MCP if available
             cmd = [
                 "gh",
@@ -123,13 +239,22 @@ class GitHubAPI:
             Query result dict
         """
         try:
-            cmd = ["gh", "api", "graphql", "-f", f"query={query}"]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return json.loads(result.stdout)
-        except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
+            return gh_graphql(query)
+        except GH_ERRORS as e:
             return {"error": str(e)}
 
 
+@functools.lru_cache(maxsize=1)
+def _default_branch() -> str:
+    """Default branch from origin/HEAD, or "main" when it isn't set."""
+    result = subprocess.run(
+        ["git", "symbolic-ref", "--short", "refs/remotes/origin/HEAD"],
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip().split("/")[-1] if result.returncode == 0 else "main"
+
+
 class GitCommands:
     """Wrapper for common Git operations."""
 
@@ -137,13 +262,7 @@ class GitCommands:
     def get_current_branch() -> str:
         """Get current branch name."""
         try:
-            result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return result.stdout.strip()
+            return _current_branch_for(os.getcwd())
         except subprocess.CalledProcessError:
             return "unknown"
 
@@ -172,14 +291,8 @@ class GitCommands:
             Tuple of (has_conflicts, merge_tree_output)
         """
         try:
-            # Get default branch
-            cmd = ["git", "symbolic-ref", "--short", "refs/remotes/origin/HEAD"]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            default_branch = (
-                result.stdout.strip().split("/")[-1]
-                if result.returncode == 0
-                else "main"
-            )
+            # Get default branch (resolved once per process)
+            default_branch = _default_branch()
 
             # Run merge-tree - first get merge base using remote tracking ref
             remote_default = f"origin/{default_branch}"
@@ -212,26 +325,31 @@ class GitCommands:
         """
         markers = []
         try:
-            with open(file_path, "r") as f:
-                lines = f.readlines()
-
-            in_conflict = False
-            conflict_start = 0
-
-            for i, line in enumerate(lines, 1):
-                if line.startswith("<<<<<<<"):
-                    in_conflict = True
-                    conflict_start = i
-                elif line.startswith(">>>>>>>") and in_conflict:
-                    markers.append(
-                        {
-                            "file": file_path,
-                            "start_line": conflict_start,
-                            "end_line": i,
-                            "lines": i - conflict_start + 1,
-                        }
-                    )
+            with open(file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return markers  # mmap can't map an empty file
+                # Scan the mapped bytes in C rather than decoding every line
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
                     in_conflict = False
+                    conflict_start = 0
+                    line, counted_to = 1, 0
+
+                    for match in _CONFLICT_MARKER_RE.finditer(mm):
+                        line += mm[counted_to:match.start()].count(b"\n")
+                        counted_to = match.start()
+                        if match.group() == b"<<<<<<<":
+                            in_conflict = True
+                            conflict_start = line
+                        elif in_conflict:
+                            markers.append(
+                                {
+                                    "file": file_path,
+                                    "start_line": conflict_start,
+                                    "end_line": line,
+                                    "lines": line - conflict_start + 1,
+                                }
+                            )
+                            in_conflict = False
         except Exception:
             pass
 
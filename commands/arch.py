@@ -6,30 +6,116 @@ Conducts comprehensive architecture reviews with fake detection,
 size optimization, and timeout prevention.
 """
 
+import ast
+import atexit
+import copy
+import functools
+import glob
+import io
+import itertools
 import os
 import subprocess
 import sys
 import time
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Any, Dict, List, Optional
 
 # Add lib directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "lib"))
 
-from fake_detector import FakeDetector
-from request_optimizer import optimize_file_read, optimizer
+# Report section rule
+_SEPARATOR = "=" * 50 + "\n"
+
+# Buffer size for reading files under analysis
+_READ_BUFFER = int(os.environ.get("ARCH_READ_BUFFER", str(1 << 20)))
+
+# Codebase scan filters
+_SKIP_DIRS = frozenset({"__pycache__", ".git", ".venv", "node_modules"})
+_SOURCE_EXTS = (".py", ".js", ".html", ".css")
+
+
+@functools.cache
+def _detector():
+    """Shared FakeDetector, imported on first use.
+
+    Stateless, so one instance serves every file and scan thread.
+    """
+    from fake_detector import FakeDetector
+
+    return FakeDetector()
+
+
+@functools.cache
+def _detect_pool() -> ThreadPoolExecutor:
+    """Pool running whole-file detection alongside truncated reads, created on first use.
+
+    Sized to the codebase scan pool, whose workers are the ones submitting.
+    """
+    pool = ThreadPoolExecutor(
+        max_workers=int(os.environ.get("ARCH_MAX_WORKERS", "4")),
+        thread_name_prefix="arch-detect",
+    )
+    atexit.register(pool.shutdown)
+    return pool
+
+
+@functools.cache
+def _optimizer():
+    """(optimize_file_read, optimizer) from request_optimizer, imported on first use."""
+    from request_optimizer import optimize_file_read, optimizer
+
+    return optimize_file_read, optimizer
+
+
+def _git_dir(start: str) -> Optional[str]:
+    """Find the git dir for ``start``, following a worktree's ``.git`` file."""
+    directory = os.path.abspath(start)
+    while True:
+        dot_git = os.path.join(directory, ".git")
+        if os.path.isdir(dot_git):
+            return dot_git
+        if os.path.isfile(dot_git):
+            with open(dot_git) as f:
+                pointer = f.read().strip()
+            if not pointer.startswith("gitdir:"):
+                return None
+            return os.path.join(directory, pointer[len("gitdir:"):].strip())
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def _current_branch() -> str:
+    """Current branch ("" when detached), read from HEAD without forking git."""
+    try:
+        git_dir = _git_dir(os.getcwd())
+        if git_dir is not None:
+            with open(os.path.join(git_dir, "HEAD")) as f:
+                head = f.read().strip()
+            if head.startswith("ref: refs/heads/"):
+                return head[len("ref: refs/heads/"):]
+            if len(head) in (40, 64):  # SHA-1 or SHA-256 object id
+                return ""  # Detached HEAD, like `git branch --show-current`
+    except OSError:
+        pass
+
+    # Unexpected layout - ask git
+    result = subprocess.run(
+        ["git", "branch", "--show-current"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
 
 
 def analyze_current_branch_architecture() -> Dict[str, Any]:
     """Analyze current branch architecture"""
     try:
-        # Get current branch
-        result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        branch = result.stdout.strip()
+        # Get current branch (read from disk; the diff is the only git call)
+        branch = _current_branch()
 
         # Get recent changes
         diff_result = subprocess.run(
@@ -56,6 +142,82 @@ def analyze_current_branch_architecture() -> Dict[str, Any]:
         }
 
 
+def _count_lines(data: bytes) -> int:
+    """len(data.splitlines()) without building the list of lines."""
+    if b"\r" in data:
+        # CR and CRLF endings need splitlines' rules
+        return len(data.splitlines())
+    return data.count(b"\n") + (0 if data.endswith(b"\n") or not data else 1)
+
+
+def _read_and_parse(filepath: str):
+    """Read a file once and parse it if it is Python.
+
+    Returns:
+        (is_blank, line_count, tree, syntax_error); tree is None for blank or
+        non-Python files and when parsing failed
+    """
+    # Bytes go straight to ast.parse (which honours PEP 263 encoding
+    # cookies), skipping a separate decode and newline-translation pass
+    with open(filepath, "rb") as f:
+        data = f.read()
+
+    is_blank = not data.strip()
+    line_count = _count_lines(data)
+    if is_blank or not filepath.endswith(".py"):
+        return is_blank, line_count, None, None
+    try:
+        return is_blank, line_count, ast.parse(data, filename=filepath), None
+    except SyntaxError as e:
+        return is_blank, line_count, None, e
+
+
+@functools.lru_cache(maxsize=4096)
+def _analyze_file_structure_cached(
+    filepath: str, mtime_ns: int, size: int
+) -> Dict[str, Any]:
+    """Structure analysis for one on-disk version of a file.
+
+    Keyed on (path, mtime, size) so edits are picked up. The returned dict
+    is the cache's own copy; analyze_file_structure hands callers a deep
+    copy of it.
+    """
+    is_blank, line_count, tree, syntax_error = _read_and_parse(filepath)
+
+    # Check for empty file
+    if is_blank:
+        return {"error": f"Empty file: {filepath}", "skipped": True}
+
+    # Check if it's a Python file for AST analysis
+    if not filepath.endswith(".py"):
+        return {"error": f"Not a Python file: {filepath}", "skipped": True}
+
+    if syntax_error is not None:
+        return {
+            "error": f"Syntax error at line {syntax_error.lineno}: {syntax_error.msg}",
+            "syntax_error": True,
+        }
+
+    # One traversal collects every metric below
+    scan = _ArchScan(tree, filepath)
+
+    # Success case - return expected structure
+    return {
+        "success": True,
+        "file": filepath,
+        "metrics": {
+            "lines": line_count,
+            "complexity": scan.complexity,
+            "function_count": scan.function_count,
+            "class_count": scan.class_count,
+        },
+        "functions": scan.functions,
+        "imports": scan.imports,
+        "classes": scan.classes,
+        "issues": scan.issues,
+    }
+
+
 # Compatibility alias for tests
 def analyze_file_structure(filepath: str) -> Dict[str, Any]:
     """
@@ -67,79 +229,77 @@ def analyze_file_structure(filepath: str) -> Dict[str, Any]:
         return {"error": f"File not found: {filepath}"}
 
     try:
-        with open(filepath, "r") as f:
-            content = f.read()
-
-        # Check for empty file
-        if not content.strip():
-            return {"error": f"Empty file: {filepath}", "skipped": True}
+        stat = os.stat(filepath)
+        # Callers may annotate or trim the result, so never expose the cached dict
+        return copy.deepcopy(
+            _analyze_file_structure_cached(filepath, stat.st_mtime_ns, stat.st_size)
+        )
 
-        # Check if it's a Python file for AST analysis
-        if not filepath.endswith(".py"):
-            return {"error": f"Not a Python file: {filepath}", "skipped": True}
+    except Exception as e:
+        return {"error": f"Analysis failed: {str(e)}", "failed": True}
 
-        # Try to parse as Python AST
-        import ast
 
-        try:
-            tree = ast.parse(content, filename=filepath)
-        except SyntaxError as e:
-            return {
-                "error": f"Syntax error at line {e.lineno}: {e.msg}",
-                "syntax_error": True,
-            }
+def _read_head(f, limit: int):
+    """Read the first ``limit`` lines of ``f`` in large chunks.
 
-        # Success case - return expected structure
-        return {
-            "success": True,
-            "file": filepath,
-            "metrics": {
-                "lines": len(content.splitlines()),
-                "complexity": calculate_cyclomatic_complexity(tree),
-                "function_count": len(
-                    [n for n in ast.walk(tree) if isinstance(n, ast.FunctionDef)]
-                ),
-                "class_count": len(
-                    [n for n in ast.walk(tree) if isinstance(n, ast.ClassDef)]
-                ),
-            },
-            "functions": extract_functions_with_complexity(tree),
-            "imports": extract_import_dependencies(tree),
-            "classes": extract_classes_with_methods(tree),
-            "issues": find_architectural_issues(tree, filepath),
-        }
+    Returns:
+        (text, truncated) - truncated is True when more follows the last line
+    """
+    chunk_size = min(limit * 200, 4_000_000) or 1
+    parts = []
+    remaining = limit
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            return "".join(parts), False
+
+        newlines = chunk.count("\n")
+        if newlines < remaining:
+            parts.append(chunk)
+            remaining -= newlines
+            continue
 
-    except Exception as e:
-        return {"error": f"Analysis failed: {str(e)}", "failed": True}
+        end = -1
+        for _ in range(remaining):
+            end = chunk.index("\n", end + 1)
+        parts.append(chunk[: end + 1])
+        return "".join(parts), end + 1 < len(chunk) or bool(f.read(1))
 
 
-def analyze_file_architecture(filepath: str) -> Dict[str, Any]:
+def analyze_file_architecture(
+    filepath: str, _skip_exists_check: bool = False
+) -> Dict[str, Any]:
     """Analyze specific file architecture with size optimization"""
-    if not os.path.exists(filepath):
+    if not _skip_exists_check and not os.path.exists(filepath):
         return {"error": f"File not found: {filepath}"}
 
     # Use request optimizer for file reading
+    optimize_file_read, _ = _optimizer()
     read_params = optimize_file_read(filepath)
 
+    # A truncated read can't feed the detector, which needs the whole file;
+    # start its own pass now so it overlaps with our read
+    pending_detection = None
+    if "limit" in read_params:
+        pending_detection = _detect_pool().submit(_detector().analyze_file, filepath)
+
     try:
-        with open(filepath, "r") as f:
+        with open(filepath, "r", buffering=_READ_BUFFER) as f:
             if "limit" in read_params:
-                # Read optimized portion for large files
-                content = []
-                for i, line in enumerate(f):
-                    if i >= read_params["limit"]:
-                        content.append(
-                            f"\n... [Truncated after {read_params['limit']} lines for analysis] ..."
-                        )
-                        break
-                    content.append(line)
-                file_content = "".join(content)
+                # Read optimized portion for large files - only the first
+                # `limit` lines are ever pulled from the file
+                file_content, truncated = _read_head(f, read_params["limit"])
+                if truncated:
+                    file_content += f"\n... [Truncated after {read_params['limit']} lines for analysis] ..."
             else:
                 file_content = f.read()
 
-        # Detect fake patterns
-        detector = FakeDetector()
-        fake_patterns = detector.analyze_file(filepath)
+        # Detect fake patterns - reuse the content we already hold when it
+        # is the whole file
+        if pending_detection is not None:
+            fake_patterns = pending_detection.result()
+        else:
+            fake_patterns = _detector().analyze_content(file_content, filepath)
 
         return {
             "filepath": filepath,
@@ -157,6 +317,50 @@ def analyze_file_architecture(filepath: str) -> Dict[str, Any]:
         return {"error": f"Could not analyze file: {str(e)}"}
 
 
+def _iter_source_files(directory: str):
+    """Yield source file paths under directory in os.walk order.
+
+    Walks with os.scandir directly so each path comes straight from its
+    DirEntry. Like os.walk, unreadable directories are skipped and symlinked
+    directories are listed but not descended into.
+    """
+    pending = [directory]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                entries = list(entries)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if not is_dir:
+                if entry.name.endswith(_SOURCE_EXTS):
+                    yield entry.path
+            # Skip hidden directories and build/dependency directories
+            elif (
+                entry.name[:1] != "."
+                and entry.name not in _SKIP_DIRS
+                and not entry.is_symlink()
+            ):
+                subdirs.append(entry.path)
+
+        # Depth-first, in listing order, to match os.walk
+        pending.extend(reversed(subdirs))
+
+
+# Paths from _iter_source_files were just listed; a file that vanished since
+# still fails cleanly at open()
+_analyze_listed_file = functools.partial(
+    analyze_file_architecture, _skip_exists_check=True
+)
+
+
 def analyze_codebase_architecture() -> Dict[str, Any]:
     """Analyze full codebase architecture with smart sampling"""
     print("🔍 Scanning codebase architecture...")
@@ -167,29 +371,32 @@ def analyze_codebase_architecture() -> Dict[str, Any]:
 
     total_files_scanned = 0
     max_files = 20  # Limit to prevent timeouts
+    max_workers = int(os.environ.get("ARCH_MAX_WORKERS", "4"))
 
-    for directory in key_dirs:
-        if not os.path.exists(directory):
-            continue
-
-        dir_results = {
-            "files_analyzed": [],
-            "fake_patterns_found": 0,
-            "total_size_chars": 0,
-        }
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for directory in key_dirs:
+            if not os.path.exists(directory):
+                continue
 
-        for root, dirs, files in os.walk(directory):
-            # Skip hidden directories and __pycache__
-            dirs[:] = [d for d in dirs if not d.startswith(".") and d != "__pycache__"]
+            dir_results = {
+                "files_analyzed": [],
+                "fake_patterns_found": 0,
+                "total_size_chars": 0,
+            }
 
-            for file in files:
-                if total_files_scanned >= max_files:
+            # Pre-slice candidates to the remaining budget; unreadable files
+            # don't count against it, so top up until the budget is spent.
+            candidates = _iter_source_files(directory)
+            while total_files_scanned < max_files:
+                paths = list(
+                    itertools.islice(candidates, max_files - total_files_scanned)
+                )
+                if not paths:
                     break
 
-                if file.endswith((".py", ".js", ".html", ".css")):
-                    filepath = os.path.join(root, file)
-                    file_analysis = analyze_file_architecture(filepath)
-
+                for filepath, file_analysis in zip(
+                    paths, executor.map(_analyze_listed_file, paths)
+                ):
                     if "error" not in file_analysis:
                         dir_results["files_analyzed"].append(
                             {
@@ -206,10 +413,7 @@ def analyze_codebase_architecture() -> Dict[str, Any]:
                         )
                         total_files_scanned += 1
 
-            if total_files_scanned >= max_files:
-                break
-
-        analysis_results[directory] = dir_results
+            analysis_results[directory] = dir_results
 
     return {
         "analysis_scope": "codebase",
@@ -219,11 +423,35 @@ def analyze_codebase_architecture() -> Dict[str, Any]:
     }
 
 
+def _approx_size(obj: Any) -> int:
+    """Approximate len(str(obj)) without materializing the repr.
+
+    Calibrated against the repr of dict/list/str scope data: quotes around
+    strings, escaped newlines, ": " per dict pair and ", " between items.
+    """
+    size = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            size += len(item) + 2 + item.count("\n")
+        elif isinstance(item, dict):
+            size += 4 * len(item) if item else 2
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            size += 2 * len(item) if item else 2
+            stack.extend(item)
+        else:
+            size += len(repr(item))
+    return size
+
+
 def perform_dual_perspective_analysis(scope_data: Dict[str, Any]) -> Dict[str, Any]:
     """Perform dual-perspective analysis with timeout mitigation"""
 
     # Check request size before proceeding
-    context_size = len(str(scope_data))
+    context_size = _approx_size(scope_data)
     if context_size > 40000:
         print(f"⚠️ Large analysis context ({context_size} chars), limiting scope...")
         # Trim scope data to prevent timeouts
@@ -251,6 +479,7 @@ def perform_dual_perspective_analysis(scope_data: Dict[str, Any]) -> Dict[str, A
 
     # Record performance
     analysis_duration = time.time() - analysis_start
+    _, optimizer = _optimizer()
     optimizer.record_success(
         "arch_dual_analysis", int(analysis_duration * 1000), context_size
     )
@@ -263,53 +492,92 @@ def perform_dual_perspective_analysis(scope_data: Dict[str, Any]) -> Dict[str, A
     }
 
 
-def generate_claude_architecture_analysis(scope_data: Dict[str, Any]) -> str:
-    """Generate Claude perspective analysis (simplified for timeout prevention)"""
+def _lines(buf: io.StringIO) -> str:
+    """Buffered report lines, without the newline after the last one."""
+    return buf.getvalue()[:-1]
 
-    findings = []
 
-    # Quick structural analysis
-    if scope_data.get("analysis_scope") == "codebase":
-        total_fake_patterns = sum(
-            dir_data.get("fake_patterns_found", 0)
-            for dir_data in scope_data.get("directories", {}).values()
-        )
+def _claude_codebase(scope_data: Dict[str, Any], w) -> None:
+    # Entries from other callers may lack the count; default it once so the
+    # sum can use itemgetter
+    directories = scope_data.get("directories", {}).values()
+    for dir_data in directories:
+        dir_data.setdefault("fake_patterns_found", 0)
+    total_fake_patterns = sum(map(itemgetter("fake_patterns_found"), directories))
 
-        findings.append("📊 Codebase Structure Analysis:")
-        findings.append(f"- Scanned {scope_data.get('total_files_scanned', 0)} files")
-        findings.append(f"- Found {total_fake_patterns} fake/demo patterns")
+    w("📊 Codebase Structure Analysis:\n")
+    w(f"- Scanned {scope_data.get('total_files_scanned', 0)} files\n")
+    w(f"- Found {total_fake_patterns} fake/demo patterns\n")
 
-        if total_fake_patterns > 10:
-            findings.append("🚨 HIGH fake pattern density - major technical debt")
-        elif total_fake_patterns > 3:
-            findings.append("⚠️ MODERATE fake patterns - needs cleanup")
-        else:
-            findings.append("✅ LOW fake pattern density - good code quality")
-
-    # File-specific analysis
-    elif scope_data.get("analysis_scope") == "single_file":
-        fake_count = scope_data.get("fake_patterns", 0)
-        findings.append(f"📄 File Analysis: {scope_data.get('filepath', 'unknown')}")
-        findings.append(f"- Size: {scope_data.get('size_chars', 0)} characters")
-        findings.append(f"- Fake patterns: {fake_count}")
-
-        if fake_count > 0:
-            findings.append(
-                "🔧 Recommended: Replace fake implementations with real logic"
-            )
+    if total_fake_patterns > 10:
+        w("🚨 HIGH fake pattern density - major technical debt\n")
+    elif total_fake_patterns > 3:
+        w("⚠️ MODERATE fake patterns - needs cleanup\n")
+    else:
+        w("✅ LOW fake pattern density - good code quality\n")
+
+
+def _claude_single_file(scope_data: Dict[str, Any], w) -> None:
+    fake_count = scope_data.get("fake_patterns", 0)
+    w(f"📄 File Analysis: {scope_data.get('filepath', 'unknown')}\n")
+    w(f"- Size: {scope_data.get('size_chars', 0)} characters\n")
+    w(f"- Fake patterns: {fake_count}\n")
+
+    if fake_count > 0:
+        w("🔧 Recommended: Replace fake implementations with real logic\n")
+
+
+def _claude_branch_changes(scope_data: Dict[str, Any], w) -> None:
+    changed_files = scope_data.get("changed_files", [])
+    w(f"🌿 Branch Analysis: {scope_data.get('branch', 'unknown')}\n")
+    w(f"- Recent changes: {len(changed_files)} files\n")
 
-    # Branch analysis
-    elif scope_data.get("analysis_scope") == "branch_changes":
-        changed_files = scope_data.get("changed_files", [])
-        findings.append(f"🌿 Branch Analysis: {scope_data.get('branch', 'unknown')}")
-        findings.append(f"- Recent changes: {len(changed_files)} files")
+    if changed_files:
+        w("- Key changes:\n")
+        for file in changed_files[:5]:
+            w(f"  • {file}\n")
+
+
+def _gemini_codebase(scope_data: Dict[str, Any], w) -> None:
+    w("- Performance: Consider lazy loading for large codebases\n")
+    w("- Scalability: Modular architecture supports growth\n")
+    w("- Innovation: Opportunity for AI-assisted refactoring\n")
+
+
+def _gemini_single_file(scope_data: Dict[str, Any], w) -> None:
+    size = scope_data.get("size_chars", 0)
+    if size > 50000:
+        w("- Performance: Large file may impact load times\n")
+        w("- Recommendation: Consider code splitting\n")
+    else:
+        w("- Size: Appropriate for single responsibility\n")
 
-        if changed_files:
-            findings.append("- Key changes:")
-            for file in changed_files[:5]:
-                findings.append(f"  • {file}")
 
-    return "\n".join(findings)
+def _gemini_branch_changes(scope_data: Dict[str, Any], w) -> None:
+    w("- Change Impact: Focused modifications reduce risk\n")
+    w("- Integration: Consider automated testing for changes\n")
+
+
+# Per-scope findings writers, keyed by scope_data["analysis_scope"]
+_CLAUDE_HANDLERS = {
+    "codebase": _claude_codebase,
+    "single_file": _claude_single_file,
+    "branch_changes": _claude_branch_changes,
+}
+_GEMINI_HANDLERS = {
+    "codebase": _gemini_codebase,
+    "single_file": _gemini_single_file,
+    "branch_changes": _gemini_branch_changes,
+}
+
+
+def generate_claude_architecture_analysis(scope_data: Dict[str, Any]) -> str:
+    """Generate Claude perspective analysis (simplified for timeout prevention)"""
+    buf = io.StringIO()
+    handler = _CLAUDE_HANDLERS.get(scope_data.get("analysis_scope"))
+    if handler:
+        handler(scope_data, buf.write)
+    return _lines(buf)
 
 
 def generate_gemini_architecture_analysis(scope_data: Dict[str, Any]) -> str:
@@ -318,30 +586,18 @@ def generate_gemini_architecture_analysis(scope_data: Dict[str, Any]) -> str:
     # For timeout prevention, generate analysis locally instead of API call
     # In production, this would call Gemini MCP with timeout handling
 
-    findings = []
-    findings.append("🤖 Gemini Consulting Perspective:")
-
-    if scope_data.get("analysis_scope") == "codebase":
-        findings.append("- Performance: Consider lazy loading for large codebases")
-        findings.append("- Scalability: Modular architecture supports growth")
-        findings.append("- Innovation: Opportunity for AI-assisted refactoring")
+    buf = io.StringIO()
+    w = buf.write
+    w("🤖 Gemini Consulting Perspective:\n")
 
-    elif scope_data.get("analysis_scope") == "single_file":
-        size = scope_data.get("size_chars", 0)
-        if size > 50000:
-            findings.append("- Performance: Large file may impact load times")
-            findings.append("- Recommendation: Consider code splitting")
-        else:
-            findings.append("- Size: Appropriate for single responsibility")
+    handler = _GEMINI_HANDLERS.get(scope_data.get("analysis_scope"))
+    if handler:
+        handler(scope_data, w)
 
-    elif scope_data.get("analysis_scope") == "branch_changes":
-        findings.append("- Change Impact: Focused modifications reduce risk")
-        findings.append("- Integration: Consider automated testing for changes")
+    w("- Alternative: Cloud-native architecture patterns\n")
+    w("- Benchmarking: Compare with industry standards\n")
 
-    findings.append("- Alternative: Cloud-native architecture patterns")
-    findings.append("- Benchmarking: Compare with industry standards")
-
-    return "\n".join(findings)
+    return _lines(buf)
 
 
 def format_architecture_report(
@@ -349,62 +605,61 @@ def format_architecture_report(
 ) -> str:
     """Format comprehensive architecture report"""
 
-    report = []
-    report.append("🏛️ ARCHITECTURE REVIEW REPORT")
-    report.append("=" * 50)
-    report.append("")
+    buf = io.StringIO()
+    w = buf.write
+    w("🏛️ ARCHITECTURE REVIEW REPORT\n")
+    w(_SEPARATOR)
+    w("\n")
 
     # Executive Summary
-    report.append("## Executive Summary")
+    w("## Executive Summary\n")
     scope = scope_data.get("analysis_scope", "unknown")
-    report.append(f"**Scope**: {scope.replace('_', ' ').title()}")
+    w(f"**Scope**: {scope.replace('_', ' ').title()}\n")
 
     if "error" in scope_data:
-        report.append(f"**Status**: ❌ Error - {scope_data['error']}")
-        return "\n".join(report)
+        w(f"**Status**: ❌ Error - {scope_data['error']}\n")
+        return _lines(buf)
 
     # Performance metrics
     duration = dual_analysis.get("analysis_duration_s", 0)
     context_size = dual_analysis.get("context_size_chars", 0)
-    report.append(f"**Analysis Time**: {duration:.1f}s")
-    report.append(f"**Context Size**: {context_size:,} characters")
-    report.append("")
+    w(f"**Analysis Time**: {duration:.1f}s\n")
+    w(f"**Context Size**: {context_size:,} characters\n")
+    w("\n")
 
     # Claude Analysis
     claude_findings = dual_analysis.get("claude_perspective", {}).get("findings", "")
     if claude_findings:
-        report.append("## 🧠 Claude Analysis (Primary Architecture)")
-        report.append(claude_findings)
-        report.append("")
+        w("## 🧠 Claude Analysis (Primary Architecture)\n")
+        w(f"{claude_findings}\n")
+        w("\n")
 
     # Gemini Analysis
     gemini_findings = dual_analysis.get("gemini_perspective", {}).get("findings", "")
     if gemini_findings:
-        report.append("## 🤖 Gemini Analysis (Consulting Perspective)")
-        report.append(gemini_findings)
-        report.append("")
+        w("## 🤖 Gemini Analysis (Consulting Perspective)\n")
+        w(f"{gemini_findings}\n")
+        w("\n")
 
     # Fake Pattern Detection
     if scope_data.get("fake_details"):
-        report.append("## 🚨 Fake Pattern Detection")
+        w("## 🚨 Fake Pattern Detection\n")
         for pattern in scope_data["fake_details"]:
-            report.append(
-                f"- **{pattern.type}** ({pattern.severity}): {pattern.description}"
-            )
-        report.append("")
+            w(f"- **{pattern.type}** ({pattern.severity}): {pattern.description}\n")
+        w("\n")
 
     # Recommendations
-    report.append("## 🛠️ Action Items")
-    report.append("### Critical")
-    report.append("- [ ] Address any fake implementations found")
-    report.append("- [ ] Verify timeout optimizations are working")
-    report.append("")
-    report.append("### Improvement")
-    report.append("- [ ] Consider performance optimizations suggested")
-    report.append("- [ ] Plan for scalability improvements")
-    report.append("")
+    w("## 🛠️ Action Items\n")
+    w("### Critical\n")
+    w("- [ ] Address any fake implementations found\n")
+    w("- [ ] Verify timeout optimizations are working\n")
+    w("\n")
+    w("### Improvement\n")
+    w("- [ ] Consider performance optimizations suggested\n")
+    w("- [ ] Plan for scalability improvements\n")
+    w("\n")
 
-    return "\n".join(report)
+    return _lines(buf)
 
 
 def main():
@@ -414,9 +669,13 @@ def main():
     args = sys.argv[1:] if len(sys.argv) > 1 else []
     scope = args[0] if args else "current"
 
-    print(f"🏛️ Architecture Review (Scope: {scope})")
-    print("🔍 Analyzing with timeout optimizations...")
-    print()
+    # The header goes out right away so there's visible progress while the
+    # scope is analyzed; everything after it is written in one go
+    sys.stdout.write(
+        f"🏛️ Architecture Review (Scope: {scope})\n"
+        "🔍 Analyzing with timeout optimizations...\n\n"
+    )
+    sys.stdout.flush()
 
     # Determine analysis scope
     if scope == "codebase":
@@ -437,158 +696,235 @@ def main():
     dual_analysis = perform_dual_perspective_analysis(scope_data)
 
     # Generate and display report
-    report = format_architecture_report(scope_data, dual_analysis)
-    print(report)
+    out = io.StringIO()
+    out.write(format_architecture_report(scope_data, dual_analysis))
+    out.write("\n")
 
     # Performance summary
     total_time = time.time() - start_time
-    print(f"\n⏱️ Total analysis time: {total_time:.1f}s")
+    out.write(f"\n⏱️ Total analysis time: {total_time:.1f}s\n")
 
     # Show optimization report if there were issues
+    _, optimizer = _optimizer()
     opt_report = optimizer.get_optimization_report()
     if "No timeouts recorded" not in opt_report:
-        print("\n📊 Optimization Report:")
-        print(opt_report)
+        out.write(f"\n📊 Optimization Report:\n{opt_report}\n")
 
+    sys.stdout.write(out.getvalue())
+    sys.stdout.flush()
 
-# Additional compatibility functions for tests
-def calculate_cyclomatic_complexity(tree) -> int:
-    """Stub implementation for cyclomatic complexity calculation"""
-    import ast
 
-    # Simple complexity calculation - count decision points
-    complexity = 1  # Base complexity
+# Node types that add a branch to cyclomatic complexity. AST node classes
+# are never subclassed, so an exact type lookup matches isinstance here.
+_DECISION_TYPES = frozenset({ast.If, ast.While, ast.For, ast.ExceptHandler, ast.With})
+_IMPORT_TYPES = frozenset({ast.Import, ast.ImportFrom})
 
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.If, ast.While, ast.For, ast.ExceptHandler, ast.With)):
-            complexity += 1
-        elif isinstance(node, ast.BoolOp):
-            complexity += len(node.values) - 1
 
-    return complexity
+# Additional compatibility functions for tests
+class _ArchScan:
+    """Every per-file AST metric, gathered in one traversal of the tree.
+
+    The tree is walked depth-first with an explicit stack (deeply nested
+    expressions can't hit the recursion limit), counting decision points
+    as it goes; a function's complexity is the count accrued while its
+    subtree was open. Entries are then re-sorted by (depth, pre-order
+    index), which is exactly ast.walk's breadth-first order, so results
+    match the per-metric helpers below.
+    """
 
+    def __init__(self, tree, filepath: str = ""):
+        self.filepath = filepath
+        self.function_count = 0
+        self.class_count = 0
+        self._decisions = 0
+        self._functions, self._imports, self._classes, self._issues = [], [], [], []
+
+        handlers = _SCAN_HANDLERS
+        order = 0
+        stack = [(tree, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth < 0:
+                self._close_function(*node)
+                continue
+
+            order += 1
+            handler = handlers.get(type(node))
+            if handler is not None:
+                handler(self, node, (depth, order), stack)
+
+            children = list(ast.iter_child_nodes(node))
+            stack.extend((child, depth + 1) for child in reversed(children))
+
+        self.complexity = tree._arch_cc = 1 + self._decisions
+        self.functions = self._walk_order(self._functions)
+        self.imports = self._walk_order(self._imports)
+        self.classes = self._walk_order(self._classes)
+        self.issues = self._walk_order(self._issues)
+
+    # Node handlers, dispatched on exact node type via _SCAN_HANDLERS
+
+    def _on_decision(self, node, key, stack) -> None:
+        self._decisions += 1
+
+    def _on_bool_op(self, node, key, stack) -> None:
+        self._decisions += len(node.values) - 1
+
+    def _on_function(self, node, key, stack) -> None:
+        self.function_count += 1
+        # Closed once the whole subtree below it has been counted
+        stack.append(((node, key, self._decisions), -1))
+
+    def _on_class(self, node, key, stack) -> None:
+        self.class_count += 1
+        self._classes.append((key, self._class_entry(node)))
+
+    def _on_import(self, node, key, stack) -> None:
+        self._imports.extend((key, entry) for entry in self._import_entries(node))
+
+    def _close_function(self, func, key, start: int) -> None:
+        complexity = 1 + self._decisions - start
+        func._arch_cc = complexity
+        self._functions.append((key, self._function_entry(func, complexity)))
+        if complexity > 10:  # High complexity threshold
+            self._issues.append((key, self._complexity_issue(func, complexity)))
+
+    @classmethod
+    def of(cls, tree, filepath: str = "") -> "_ArchScan":
+        """Scan ``tree`` once, memoized on the node itself.
+
+        Results are stored as fields on the nodes they describe (the scan on
+        the root, complexity as ``_arch_cc`` on each FunctionDef), so the
+        helpers below share one traversal. Trees are treated as read-only
+        once scanned.
+        """
+        scan = getattr(tree, "_arch_scan", None)
+        if scan is None or scan.filepath != filepath:
+            scan = tree._arch_scan = cls(tree, filepath)
+        return scan
+
+    @staticmethod
+    def _walk_order(entries: List[tuple]) -> List[Dict[str, Any]]:
+        """Drop the sort keys after putting entries in ast.walk order."""
+        return [entry for _, entry in sorted(entries, key=lambda pair: pair[0])]
+
+    @staticmethod
+    def _function_entry(node, complexity: int) -> Dict[str, Any]:
+        return {
+            "name": node.name,
+            "line": getattr(node, "lineno", 0),
+            "complexity": complexity,
+            "args_count": len(node.args.args) if hasattr(node, "args") else 0,
+        }
 
-def extract_functions_with_complexity(tree) -> List[Dict[str, Any]]:
-    """Stub implementation for extracting functions with complexity"""
-    import ast
+    def _complexity_issue(self, node, complexity: int) -> Dict[str, Any]:
+        return {
+            "type": "high_complexity",
+            "location": f"{self.filepath}:{getattr(node, 'lineno', 0)}",
+            "message": f"Function {node.name} has high complexity ({complexity})",
+            "severity": "warning",
+            "complexity": complexity,
+            "function_name": node.name,
+            "suggestion": f"Consider refactoring {node.name} to reduce complexity from {complexity} to under 10",
+        }
 
-    functions = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef):
-            func_complexity = calculate_cyclomatic_complexity(node)
-            functions.append(
+    @staticmethod
+    def _import_entries(node) -> List[Dict[str, Any]]:
+        if isinstance(node, ast.Import):
+            return [
                 {
-                    "name": node.name,
+                    "type": "import",
+                    "module": alias.name,
                     "line": getattr(node, "lineno", 0),
-                    "complexity": func_complexity,
-                    "args_count": len(node.args.args) if hasattr(node, "args") else 0,
                 }
-            )
-
-    return functions
-
-
-def extract_import_dependencies(tree) -> List[Dict[str, Any]]:
-    """Stub implementation for extracting import dependencies"""
-    import ast
+                for alias in node.names
+            ]
+        module = getattr(node, "module", "") or ""
+        return [
+            {
+                "type": "from_import",
+                "module": module,
+                "name": alias.name,
+                "line": getattr(node, "lineno", 0),
+            }
+            for alias in node.names
+        ]
 
-    imports = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                imports.append(
-                    {
-                        "type": "import",
-                        "module": alias.name,
-                        "line": getattr(node, "lineno", 0),
-                    }
+    @staticmethod
+    def _class_entry(node) -> Dict[str, Any]:
+        methods = []
+        for item in node.body:
+            if isinstance(item, ast.FunctionDef):
+                # Check if method has @property decorator
+                is_property = any(
+                    isinstance(dec, ast.Name) and dec.id == "property"
+                    for dec in getattr(item, "decorator_list", [])
+                )
+                # Check if method has @staticmethod decorator
+                is_static = any(
+                    isinstance(dec, ast.Name) and dec.id == "staticmethod"
+                    for dec in getattr(item, "decorator_list", [])
                 )
-        elif isinstance(node, ast.ImportFrom):
-            module = getattr(node, "module", "") or ""
-            for alias in node.names:
-                imports.append(
+                # Check if method has @classmethod decorator
+                is_class = any(
+                    isinstance(dec, ast.Name) and dec.id == "classmethod"
+                    for dec in getattr(item, "decorator_list", [])
+                )
+                methods.append(
                     {
-                        "type": "from_import",
-                        "module": module,
-                        "name": alias.name,
-                        "line": getattr(node, "lineno", 0),
+                        "name": item.name,
+                        "line": getattr(item, "lineno", 0),
+                        "is_property": is_property,
+                        "is_static": is_static,
+                        "is_class": is_class,
                     }
                 )
 
-    return imports
+        return {
+            "name": node.name,
+            "line": getattr(node, "lineno", 0),
+            "methods": methods,
+            "method_count": len(methods),
+        }
+
+
+_SCAN_HANDLERS = {
+    **dict.fromkeys(_DECISION_TYPES, _ArchScan._on_decision),
+    ast.BoolOp: _ArchScan._on_bool_op,
+    ast.FunctionDef: _ArchScan._on_function,
+    ast.ClassDef: _ArchScan._on_class,
+    **dict.fromkeys(_IMPORT_TYPES, _ArchScan._on_import),
+}
+
+
+def calculate_cyclomatic_complexity(tree) -> int:
+    """Stub implementation for cyclomatic complexity calculation"""
+    # Simple complexity calculation - count decision points
+    complexity = getattr(tree, "_arch_cc", None)
+    if complexity is None:
+        complexity = _ArchScan.of(tree).complexity
+    return complexity
+
+
+def extract_functions_with_complexity(tree) -> List[Dict[str, Any]]:
+    """Stub implementation for extracting functions with complexity"""
+    return _ArchScan.of(tree).functions
+
+
+def extract_import_dependencies(tree) -> List[Dict[str, Any]]:
+    """Stub implementation for extracting import dependencies"""
+    return _ArchScan.of(tree).imports
 
 
 def extract_classes_with_methods(tree) -> List[Dict[str, Any]]:
     """Stub implementation for extracting classes with methods"""
-    import ast
-
-    classes = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.ClassDef):
-            methods = []
-            for item in node.body:
-                if isinstance(item, ast.FunctionDef):
-                    # Check if method has @property decorator
-                    is_property = any(
-                        isinstance(dec, ast.Name) and dec.id == "property"
-                        for dec in getattr(item, "decorator_list", [])
-                    )
-                    # Check if method has @staticmethod decorator
-                    is_static = any(
-                        isinstance(dec, ast.Name) and dec.id == "staticmethod"
-                        for dec in getattr(item, "decorator_list", [])
-                    )
-                    # Check if method has @classmethod decorator
-                    is_class = any(
-                        isinstance(dec, ast.Name) and dec.id == "classmethod"
-                        for dec in getattr(item, "decorator_list", [])
-                    )
-                    methods.append(
-                        {
-                            "name": item.name,
-                            "line": getattr(item, "lineno", 0),
-                            "is_property": is_property,
-                            "is_static": is_static,
-                            "is_class": is_class,
-                        }
-                    )
-
-            classes.append(
-                {
-                    "name": node.name,
-                    "line": getattr(node, "lineno", 0),
-                    "methods": methods,
-                    "method_count": len(methods),
-                }
-            )
-
-    return classes
+    return _ArchScan.of(tree).classes
 
 
 def find_architectural_issues(tree, filepath: str) -> List[Dict[str, Any]]:
     """Stub implementation for finding architectural issues"""
-    import ast
-
-    issues = []
-
     # Check for high complexity functions
-    for node in ast.walk(tree):
-        if isinstance(node, ast.FunctionDef):
-            complexity = calculate_cyclomatic_complexity(node)
-            if complexity > 10:  # High complexity threshold
-                issues.append(
-                    {
-                        "type": "high_complexity",
-                        "location": f"{filepath}:{getattr(node, 'lineno', 0)}",
-                        "message": f"Function {node.name} has high complexity ({complexity})",
-                        "severity": "warning",
-                        "complexity": complexity,
-                        "function_name": node.name,
-                        "suggestion": f"Consider refactoring {node.name} to reduce complexity from {complexity} to under 10",
-                    }
-                )
-
-    return issues
+    return _ArchScan.of(tree, filepath).issues
 
 
 def generate_evidence_based_insights(analysis_results: List[Dict]) -> List[Dict]:
@@ -658,23 +994,24 @@ def format_analysis_for_arch_command(
     analysis_results: List[Dict], insights: List[Dict]
 ) -> str:
     """Stub implementation for formatting analysis"""
-    report = []
-    report.append("## Technical Analysis")
-    report.append("")
+    buf = io.StringIO()
+    w = buf.write
+    w("## Technical Analysis\n")
+    w("\n")
 
     if analysis_results:
-        report.append("### Files Analyzed")
+        w("### Files Analyzed\n")
         for result in analysis_results:
             file_name = result.get("file", "unknown")
             metrics = result.get("metrics", {})
-            report.append(f"- **{file_name}**:")
-            report.append(f"  - Complexity: {metrics.get('complexity', 0)}")
-            report.append(f"  - Functions: {metrics.get('function_count', 0)}")
-            report.append(f"  - Classes: {metrics.get('class_count', 0)}")
-        report.append("")
+            w(f"- **{file_name}**:\n")
+            w(f"  - Complexity: {metrics.get('complexity', 0)}\n")
+            w(f"  - Functions: {metrics.get('function_count', 0)}\n")
+            w(f"  - Classes: {metrics.get('class_count', 0)}\n")
+        w("\n")
 
     if insights:
-        report.append("### Key Findings")
+        w("### Key Findings\n")
         for insight in insights:
             severity = insight.get("severity", "info").upper()
             finding = insight.get("finding", "No details")
@@ -686,20 +1023,17 @@ def format_analysis_for_arch_command(
                 if severity == "INFO"
                 else "🔍"
             )
-            report.append(f"- **{severity}** {emoji}: {finding}")
-        report.append("")
+            w(f"- **{severity}** {emoji}: {finding}\n")
+        w("\n")
 
-    report.append("---")
-    report.append("*Analysis provided by architecture command*")
+    w("---\n")
+    w("*Analysis provided by architecture command*\n")
 
-    return "\n".join(report)
+    return _lines(buf)
 
 
 def analyze_project_files(file_patterns: List[str]) -> Dict[str, Any]:
     """Stub implementation for project analysis"""
-    import glob
-
-    analysis_results = []
     all_files = []
 
     # Collect files matching patterns
@@ -707,24 +1041,15 @@ def analyze_project_files(file_patterns: List[str]) -> Dict[str, Any]:
         files = glob.glob(pattern, recursive=True)
         all_files.extend(files)
 
-    # Analyze each file
-    for filepath in all_files:
-        if filepath.endswith(".py"):
-            result = analyze_file_structure(filepath)
-            if result.get("success"):
-                analysis_results.append(result)
+    # Analyze each Python file once; successes and syntax errors both come
+    # from the same results
+    results = [analyze_file_structure(p) for p in all_files if p.endswith(".py")]
+    analysis_results = [r for r in results if r.get("success")]
+    syntax_errors = sum(1 for r in results if r.get("syntax_error"))
 
     # Generate insights
     insights = generate_evidence_based_insights(analysis_results)
 
-    # Count syntax errors
-    syntax_errors = 0
-    for filepath in all_files:
-        if filepath.endswith(".py"):
-            result = analyze_file_structure(filepath)
-            if result.get("syntax_error"):
-                syntax_errors += 1
-
     return {
         "analysis_results": analysis_results,
         "insights": insights,
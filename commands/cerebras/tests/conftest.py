@@ -0,0 +1,157 @@
+"""
+Shared fixtures for the cerebras_direct.sh tests
+
+Every test only reads the script and passes env vars per invocation, so the
+suite is safe under pytest-xdist (`pytest -n auto --dist loadfile`): each
+worker builds its own session fixtures, including its own ScriptShell and
+scratch directory. It isn't turned on by default - with one warm shell the
+whole file runs in well under a second, less than xdist's worker start-up.
+"""
+
+import os
+import shlex
+import shutil
+import tempfile
+from pathlib import Path
+from subprocess import PIPE, CompletedProcess, Popen
+
+import pytest
+
+# Same script as TestCerebrasWrapper.SCRIPT_PATH
+SCRIPT_PATH = str((Path(__file__).resolve().parents[1] / "cerebras_direct.sh").resolve())
+_SCRIPT_BYTES = os.fsencode(SCRIPT_PATH)
+
+_DONE = "__CEREBRAS_TEST_DONE__"
+
+
+class ScriptShell:
+    """One long-lived bash that runs the script in forked subshells
+
+    Each run sources the script inside `( ... )`, so it gets a fresh copy of
+    the shell state and its `exit` only ends the subshell - without paying
+    for a new bash exec per test. stdout/stderr go to scratch files so they
+    stay separate, and stdin is /dev/null so the script can't eat the
+    command stream.
+
+    The script is deterministic for the paths under test, so results are
+    memoized per (args, env) and repeated invocations aren't re-run.
+    Returned results are shared and must not be modified.
+    """
+
+    def __init__(self, env=None):
+        self._scratch = tempfile.mkdtemp(prefix="cerebras-tests-")
+        self._stdout_path = os.path.join(self._scratch, "stdout")
+        self._stderr_path = os.path.join(self._scratch, "stderr")
+        self._results = {}
+        # The only process this suite spawns from Python; runs fork inside bash
+        self._bash = Popen(
+            ["bash", "--noprofile", "--norc", "-s"],
+            stdin=PIPE,
+            stdout=PIPE,
+            text=True,
+            env=env,
+        )
+
+    def run(self, *args, env=None):
+        """Run the script with args (and extra env vars), like subprocess.run"""
+        key = (args, frozenset((env or {}).items()))
+        result = self._results.get(key)
+        if result is None:
+            result = self._results[key] = self._run(args, env)
+        return result
+
+    def _run(self, args, env):
+        exports = "".join(
+            f"export {name}={shlex.quote(value)}; " for name, value in (env or {}).items()
+        )
+        command = " ".join(shlex.quote(arg) for arg in (SCRIPT_PATH, *args))
+        self._bash.stdin.write(
+            f"( {exports}source {command} ) "
+            f">{shlex.quote(self._stdout_path)} 2>{shlex.quote(self._stderr_path)} </dev/null; "
+            f'echo "{_DONE} $?"\n'
+        )
+        self._bash.stdin.flush()
+
+        status = self._bash.stdout.readline().split()
+        assert status[:1] == [_DONE], "bash test shell exited unexpectedly"
+
+        return CompletedProcess(
+            [SCRIPT_PATH, *args],
+            int(status[1]),
+            self._read_capture(self._stdout_path),
+            self._read_capture(self._stderr_path),
+        )
+
+    @staticmethod
+    def _read_capture(path):
+        # Outputs are tiny: one raw read and a single decode
+        with open(path, "rb", buffering=0) as f:
+            return f.read().decode("utf-8", "replace")
+
+    def close(self):
+        self._bash.stdin.close()
+        self._bash.wait()
+        shutil.rmtree(self._scratch, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def script_stat():
+    """Single os.stat of the script, or None if it is missing"""
+    try:
+        return os.stat(_SCRIPT_BYTES)
+    except FileNotFoundError:
+        return None
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _script_precheck(script_stat):
+    """Stop every test up front if there is no script to test"""
+    if script_stat is None:
+        pytest.fail(f"Script {SCRIPT_PATH} does not exist")
+
+
+@pytest.fixture(scope="session")
+def script_header_bytes():
+    """First 64 bytes of the script, read once with a raw fd"""
+    fd = os.open(_SCRIPT_BYTES, os.O_RDONLY)
+    try:
+        return os.read(fd, 64)
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture(scope="session")
+def base_env():
+    """Minimal environment every run starts from; per-run overrides are layered on top
+
+    This is the test contract: the script only gets PATH (for curl/jq/sed)
+    plus whatever a test sets explicitly. API keys from the developer's
+    shell never reach it, so no test can turn into a live API call.
+    """
+    return {"PATH": os.environ.get("PATH", "/usr/bin:/bin")}
+
+
+@pytest.fixture(scope="session")
+def script_shell(base_env):
+    """Warm bash interpreter shared by every script invocation"""
+    shell = ScriptShell(env=base_env)
+    yield shell
+    shell.close()
+
+
+@pytest.fixture(scope="session")
+def test_prompt_result(script_shell):
+    """Output of `cerebras_direct.sh test prompt`, run once for every output check"""
+    return script_shell.run("test", "prompt", env={"OPENAI_BASE_URL": "https://api.cerebras.ai/v1"})
+
+
+@pytest.fixture(scope="session")
+def valid_prompt_result(script_shell):
+    """Output of `cerebras_direct.sh valid prompt`"""
+    return script_shell.run("valid", "prompt")
+
+
+@pytest.fixture
+def script_result(request, script_shell):
+    """Output for the argv tuple given via indirect parametrization"""
+    return script_shell.run(*request.param)
@@ -4,18 +4,237 @@ Claude Commands Exporter
 Exports Claude Code command system to GitHub repository with automatic PR creation
 """
 
+import atexit
+import contextlib
+import contextvars
+import functools
+import io
 import os
 import sys
 import time
 import subprocess
 import tempfile
 import shutil
+import tarfile
 import re
 import json
+import threading
 import requests
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Content filtering is small-file read/write, so it runs on more threads than cores
+_FILTER_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Version detection and README templating patterns
+_TAG_VERSION_RE = re.compile(r'v?(\d+\.\d+\.\d+)')
+_VERSION_TAG_RE = re.compile(r'### v(\d+\.\d+\.\d+)')
+_VERSION_SECTION_RE = re.compile(r'## 📚 Version History\s*\n\n(.*?)(?=\n---|\nGenerated with|\Z)', re.DOTALL)
+_LLM_PLACEHOLDER_RE = re.compile(r'<!--\s*LLM_VERSION_START\s*-->.*?<!--\s*LLM_VERSION_END\s*-->', re.DOTALL)
+
+
+@functools.lru_cache(maxsize=8)
+def _git_toplevel(cwd):
+    """Git toplevel for cwd, resolved once per directory"""
+    result = subprocess.run(['git', 'rev-parse', '--show-toplevel'],
+                          capture_output=True, text=True, cwd=cwd)
+    if result.returncode != 0:
+        raise Exception("Not in a git repository")
+    return result.stdout.strip()
+
+
+@functools.lru_cache(maxsize=8)
+def _git_latest_tag(cwd):
+    """Most recent tag reachable from HEAD in cwd, or None if there is none"""
+    result = subprocess.run(['git', 'describe', '--tags', '--abbrev=0'],
+                          capture_output=True, text=True, cwd=cwd)
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+@functools.cache
+def _filter_pool():
+    """Content filtering pool shared by every export section, created on first use"""
+    pool = ThreadPoolExecutor(max_workers=_FILTER_WORKERS, thread_name_prefix="export-filter")
+    atexit.register(pool.shutdown)
+    return pool
+
+
+# Output buffer of the export section running in the current context, if any
+_section_output = contextvars.ContextVar("section_output", default=None)
+
+
+class _SectionLog(io.TextIOBase):
+    """stdout stand-in that holds each concurrent export section's output until it finishes"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._lock = threading.Lock()
+
+    def write(self, text):
+        buffer = _section_output.get()
+        if buffer is None:
+            with self._lock:
+                return self._stream.write(text)
+        return buffer.write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def run(self, section, *args):
+        """Run section, then print everything it wrote in one block"""
+        buffer = io.StringIO()
+        token = _section_output.set(buffer)
+        try:
+            return section(*args)
+        finally:
+            _section_output.reset(token)
+            with self._lock:
+                self._stream.write(buffer.getvalue())
+                self._stream.flush()
+
+
+def _top_level_files(directory, suffixes, skip=()):
+    """Paths of the files directly in directory with one of suffixes
+
+    A single scandir pass; subdirectories are recognised from the listing
+    itself, so plain entries cost no extra stat.
+    """
+    with os.scandir(directory) as it:
+        entries = list(it)
+    paths = []
+    for entry in entries:
+        if entry.is_file() and os.path.splitext(entry.name)[1] in suffixes:
+            if entry.name in skip:
+                print(f"   ⏭ Skipping {entry.name} (project-specific)")
+                continue
+            paths.append(entry.path)
+    return paths
+
+
+def _copy_data(fsrc, fdst):
+    """Copy the open file fsrc into fdst
+
+    Where os.copy_file_range exists (Linux) the data is copied in the kernel,
+    which is a reflink clone on copy-on-write filesystems; if that fails the
+    copy restarts through shutil.copyfileobj.
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if not copied:
+                    break
+                remaining -= copied
+            return
+        except OSError:
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+    shutil.copyfileobj(fsrc, fdst)
+
+
+def _fast_copy(src, dst):
+    """Copy src to dst with its metadata, like shutil.copy2, via _copy_data"""
+    if not hasattr(os, 'copy_file_range'):
+        return shutil.copy2(src, dst)
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        _copy_data(fsrc, fdst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _mtime_ns(path):
+    """st_mtime_ns of path, or None if it doesn't exist"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _make_executable(file_path, mode=0o755):
+    """chmod file_path, ignoring filesystems that don't support it"""
+    try:
+        os.chmod(file_path, mode)
+    except (OSError, NotImplementedError):
+        # On Windows or unsupported filesystems, ignore chmod errors
+        pass
+
+
+def _copy_and_fix_mode(src, dst, mode):
+    """Copy src to dst with mode set, like shutil.copy2 followed by a chmod
+
+    Data, mode and timestamps all go through the one open descriptor instead
+    of copy2's copystat and a second chmod path lookup. Without os.fchmod
+    (Windows) it falls back to exactly that.
+    """
+    if not hasattr(os, 'fchmod'):
+        shutil.copy2(src, dst)
+        _make_executable(dst, mode)
+        return dst
+    with open(src, 'rb') as fsrc:
+        st = os.fstat(fsrc.fileno())
+        with open(os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode), 'wb') as fdst:
+            _copy_data(fsrc, fdst)
+            fdst.flush()
+            # O_CREAT's mode is masked by the umask and ignored for existing files
+            os.fchmod(fdst.fileno(), mode)
+            os.utime(fdst.fileno(), ns=(st.st_atime_ns, st.st_mtime_ns))
+    return dst
+
+
+def _copy_hook(src, dst):
+    """Copy one hook file, making scripts executable in the same pass"""
+    if dst.endswith(('.sh', '.py')):
+        return _copy_and_fix_mode(src, dst, 0o755)
+    return shutil.copy2(src, dst)
+
+
+def _scandir_copy(src_dir, dst_dir, skip_dirs, suffixes=None, copied=None, copy_function=shutil.copy2):
+    """Recursively copy src_dir into dst_dir, returning the copied file paths
+
+    Directories named in skip_dirs are pruned at any depth and symlinked
+    directories are not followed; with suffixes, only matching files are
+    copied, each with copy_function. File types come from the scandir
+    entries, not extra stat calls.
+    """
+    if copied is None:
+        copied = []
+    os.makedirs(dst_dir, exist_ok=True)
+    with os.scandir(src_dir) as it:
+        entries = list(it)
+    for entry in entries:
+        dst = os.path.join(dst_dir, entry.name)
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in skip_dirs:
+                _scandir_copy(entry.path, dst, skip_dirs, suffixes, copied, copy_function)
+        elif entry.is_file() and (suffixes is None or entry.name.endswith(suffixes)):
+            copied.append(copy_function(entry.path, dst))
+    return copied
 
 class ClaudeCommandsExporter:
+    # Placeholder transformations, applied in one pass by _apply_content_filtering.
+    # 'jleechan' directly before 'mvp_site/' still counts as a whole word: the
+    # old chained re.sub calls had already turned that into '$PROJECT_ROOT/'.
+    _FILTER_PATTERN = re.compile(
+        r'mvp_site/|worldarchitect\.ai|\bjleechan(?:\b|(?=mvp_site/))|TESTING=true vpython|WorldArchitect\.AI'
+    )
+    _FILTER_MAP = {
+        'mvp_site/': '$PROJECT_ROOT/',
+        'worldarchitect.ai': 'your-project.com',
+        'jleechan': '$USER',
+        'TESTING=true vpython': 'TESTING=true python',
+        'WorldArchitect.AI': 'Your Project',
+    }
+    # Byte-level twins for pure-ASCII files, where bytes and str matching agree
+    _FILTER_PATTERN_BYTES = re.compile(_FILTER_PATTERN.pattern.encode('ascii'))
+    _FILTER_MAP_BYTES = {key.encode('ascii'): value.encode('ascii') for key, value in _FILTER_MAP.items()}
+
+    # Project-specific orchestration directories, pruned at any depth by both
+    # the rsync export and the manual fallback
+    _ORCHESTRATION_EXCLUDES = ('analysis', 'automation', 'claude-bot-commands', 'coding_prompts', 'prototype', 'tasks')
+
     def __init__(self):
         self.project_root = self._get_project_root()
         self.export_dir = os.path.join(tempfile.gettempdir(), f"claude_commands_export_{int(time.time())}")
@@ -37,17 +256,22 @@ class ClaudeCommandsExporter:
         self.current_version = None
         self.change_summary = ""
 
+        # Target repository README, fetched at most once per export
+        self._target_readme = None
+        # (VERSION/package.json stamp, version) from the last _detect_version
+        self._detected_version = None
+
     def _get_project_root(self):
         """Get the project root directory"""
-        result = subprocess.run(['git', 'rev-parse', '--show-toplevel'],
-                              capture_output=True, text=True)
-        if result.returncode != 0:
-            raise Exception("Not in a git repository")
-        return result.stdout.strip()
+        return _git_toplevel(os.getcwd())
 
     def export(self):
         """Main export workflow"""
         try:
+            # Phase 2 can't run without a token; fail before doing the Phase 1 work
+            if not self.github_token:
+                raise Exception("GITHUB_TOKEN environment variable not set")
+
             print("🚀 Starting Claude Commands Export...")
             print("=" * 50)
 
@@ -74,20 +298,23 @@ class ClaudeCommandsExporter:
         for subdir in self.EXPORT_SUBDIRS:
             os.makedirs(os.path.join(staging_dir, subdir), exist_ok=True)
 
-        # Export commands
-        self._export_commands(staging_dir)
-
-        # Export hooks
-        self._export_hooks(staging_dir)
-
-        # Export agents
-        self._export_agents(staging_dir)
-
-        # Export infrastructure scripts
-        self._export_infrastructure_scripts(staging_dir)
-
-        # Export orchestration (with exclusions)
-        self._export_orchestration(staging_dir)
+        # Export commands, hooks, agents, infrastructure scripts and orchestration
+        # (with exclusions) concurrently. Each section reads and writes its own
+        # directories and only touches its own counter, so they need no locking;
+        # each one's progress lines are printed together once it finishes.
+        sections = (
+            self._export_commands,
+            self._export_hooks,
+            self._export_agents,
+            self._export_infrastructure_scripts,
+            self._export_orchestration,
+        )
+        section_log = _SectionLog(sys.stdout)
+        with contextlib.redirect_stdout(section_log), \
+                ThreadPoolExecutor(max_workers=len(sections), thread_name_prefix="export") as pool:
+            futures = [pool.submit(section_log.run, section, staging_dir) for section in sections]
+            for future in futures:
+                future.result()
         
         # Generate README
         self._generate_readme()
@@ -102,7 +329,11 @@ class ClaudeCommandsExporter:
         print("📋 Exporting command definitions...")
 
         commands_dir = os.path.join(self.project_root, '.claude', 'commands')
-        if not os.path.exists(commands_dir):
+        try:
+            # Skip project-specific files
+            sources = _top_level_files(commands_dir, ('.md', '.py'),
+                                       skip={'testi.sh', 'run_tests.sh', 'copilot_inline_reply_example.sh'})
+        except (FileNotFoundError, NotADirectoryError):
             print("⚠️  Warning: .claude/commands directory not found")
             return
 
@@ -111,44 +342,34 @@ class ClaudeCommandsExporter:
         # Ensure target directory exists
         os.makedirs(target_dir, exist_ok=True)
 
-        for file_path in Path(commands_dir).glob('*'):
-            if file_path.is_file() and file_path.suffix in ['.md', '.py']:
-                filename = file_path.name
-
-                # Skip project-specific files
-                if filename in ['testi.sh', 'run_tests.sh', 'copilot_inline_reply_example.sh']:
-                    print(f"   ⏭ Skipping {filename} (project-specific)")
-                    continue
-
-                target_path = os.path.join(target_dir, filename)
-                shutil.copy2(file_path, target_path)
+        exported = []
+        for source in sources:
+            exported.append(shutil.copy2(source, target_dir))
 
-                # Apply content transformations
-                self._apply_content_filtering(target_path)
+            print(f"   • {os.path.basename(source)}")
+            self.commands_count += 1
 
-                print(f"   • {filename}")
-                self.commands_count += 1
+        # Apply content transformations
+        self._filter_files(exported)
 
         print(f"✅ Exported {self.commands_count} commands")
 
     def _copy_hooks_manual(self, hooks_dir, target_dir):
-        """Windows fallback - manual directory copy with filtering"""
-        import shutil
-        for root, dirs, files in os.walk(hooks_dir):
-            # Filter out nested .claude directories during traversal
-            dirs[:] = [d for d in dirs if d != '.claude']
-            
-            rel_path = os.path.relpath(root, hooks_dir)
-            target_root = os.path.join(target_dir, rel_path) if rel_path != '.' else target_dir
-            os.makedirs(target_root, exist_ok=True)
-            
-            for file in files:
-                if file.endswith(('.sh', '.py', '.md')):
-                    src_file = os.path.join(root, file)
-                    dst_file = os.path.join(target_root, file)
-                    shutil.copy2(src_file, dst_file)
+        """Windows fallback - manual directory copy with filtering, returns the copied files"""
+        # Filter out nested .claude directories during traversal
+        copied = _scandir_copy(hooks_dir, target_dir, {'.claude'}, ('.sh', '.py', '.md'),
+                               copy_function=_copy_hook)
+        for dst_file in copied:
+            self._finish_hook_file(dst_file, target_dir)
         
         print("   ✅ Hooks exported using manual copy")
+        return copied
+
+    def _finish_hook_file(self, file_path, target_dir):
+        """Count and report one exported hook file"""
+        self.hooks_count += 1
+        rel_path = os.path.relpath(file_path, target_dir)
+        print(f"   📎 {rel_path}")
 
     def _export_hooks(self, staging_dir):
         """Export Claude Code hooks with proper permissions, avoiding duplicates"""
@@ -165,47 +386,46 @@ class ClaudeCommandsExporter:
         try:
             cmd = [
                 'rsync', '-av',
-                '--exclude=*/.claude/',      # Exclude nested .claude directories FIRST
-                '--exclude=*/.claude/**',    # Exclude all content within nested .claude directories
+                '-W', '--inplace', '--no-compress',  # Local copy: whole files, written in place
+                '--exclude=.claude/',        # Prune .claude directories at any depth FIRST (never descended)
                 '--include=*/',              # Then include directories
                 '--include=*.sh',
                 '--include=*.py',
                 '--include=*.md',
                 '--exclude=*',               # Finally exclude everything else
+                '--out-format=%n',           # One line per transferred path, relative to target
+                '-8',                        # Print non-ASCII names verbatim, not as \#ooo escapes
                 f"{hooks_dir}/",
                 f"{target_dir}/"
             ]
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Names decode the way os does, so any byte sequence maps back to the file
+            result = subprocess.run(cmd, capture_output=True, text=True, errors='surrogateescape')
             if result.returncode != 0:
                 print(f"   rsync failed ({result.stderr}), using manual copy fallback...")
-                self._copy_hooks_manual(hooks_dir, target_dir)
+                exported = self._copy_hooks_manual(hooks_dir, target_dir)
             else:
                 print("   ✅ Hooks exported using rsync")
+
+                # Use the files rsync reports instead of re-walking the target tree
+                # (directory entries end in '/', -v header/summary lines never match)
+                exported = []
+                for line in result.stdout.splitlines():
+                    if line.endswith(('.sh', '.py', '.md')):
+                        file_path = os.path.join(target_dir, line)
+                        # Ensure scripts are executable (with Windows compatibility)
+                        if line.endswith(('.sh', '.py')):
+                            _make_executable(file_path)
+                        self._finish_hook_file(file_path, target_dir)
+                        exported.append(file_path)
                 
         except FileNotFoundError:
             # Windows fallback - manual directory copy with filtering
             print("   rsync not found, using Windows-compatible manual copy...")
-            self._copy_hooks_manual(hooks_dir, target_dir)
-
-        # Apply content filtering and count files
-        for root, dirs, files in os.walk(target_dir):
-            for file in files:
-                if file.endswith(('.sh', '.py', '.md')):
-                    file_path = os.path.join(root, file)
-                    self._apply_content_filtering(file_path)
-
-                    # Ensure scripts are executable (with Windows compatibility)
-                    if file.endswith(('.sh', '.py')):
-                        try:
-                            os.chmod(file_path, 0o755)
-                        except (OSError, NotImplementedError):
-                            # On Windows or unsupported filesystems, ignore chmod errors
-                            pass
-
-                    self.hooks_count += 1
-                    rel_path = os.path.relpath(file_path, target_dir)
-                    print(f"   📎 {rel_path}")
+            exported = self._copy_hooks_manual(hooks_dir, target_dir)
+
+        # Apply content filtering
+        self._filter_files(exported)
 
         print(f"✅ Exported {self.hooks_count} hooks")
 
@@ -214,21 +434,24 @@ class ClaudeCommandsExporter:
         print("🤖 Exporting Claude Code agents...")
         
         agents_dir = os.path.join(self.project_root, '.claude', 'agents')
-        if not os.path.exists(agents_dir):
+        try:
+            sources = _top_level_files(agents_dir, ('.md',))
+        except (FileNotFoundError, NotADirectoryError):
             print("⚠️  Warning: .claude/agents directory not found")
             return
             
         target_dir = os.path.join(staging_dir, 'agents')
-        for file_path in Path(agents_dir).glob('*'):
-            if file_path.is_file() and file_path.suffix == '.md':
-                # Copy file
-                shutil.copy2(file_path, target_dir)
-                self.agents_count += 1
-                print(f"   🤖 {file_path.name}")
-                
-                # Apply content filtering if needed
-                target_file = os.path.join(target_dir, file_path.name)
-                self._apply_content_filtering(target_file)
+        os.makedirs(target_dir, exist_ok=True)
+
+        exported = []
+        for source in sources:
+            # Copy file
+            exported.append(shutil.copy2(source, target_dir))
+            self.agents_count += 1
+            print(f"   🤖 {os.path.basename(source)}")
+        
+        # Apply content filtering if needed
+        self._filter_files(exported)
         
         print(f"✅ Exported {self.agents_count} agents")
 
@@ -246,15 +469,20 @@ class ClaudeCommandsExporter:
             'resolve_conflicts.sh', 'sync_branch.sh'
         ]
 
+        exported = []
         for script_name in script_patterns:
             script_path = os.path.join(self.project_root, script_name)
-            if os.path.exists(script_path):
-                target_path = os.path.join(target_dir, script_name)
-                shutil.copy2(script_path, target_path)
-                self._apply_content_filtering(target_path)
+            target_path = os.path.join(target_dir, script_name)
+            try:
+                exported.append(_fast_copy(script_path, target_path))
+            except FileNotFoundError:
+                # Not every project has every script
+                continue
 
-                print(f"   • {script_name}")
-                self.scripts_count += 1
+            print(f"   • {script_name}")
+            self.scripts_count += 1
+
+        self._filter_files(exported)
 
         print(f"✅ Exported {self.scripts_count} infrastructure scripts")
 
@@ -269,17 +497,13 @@ class ClaudeCommandsExporter:
 
         target_dir = os.path.join(staging_dir, 'orchestration')
 
-        # Use rsync with explicit exclusions
-        exclude_patterns = [
-            '--exclude=analysis/',
-            '--exclude=automation/',
-            '--exclude=claude-bot-commands/',
-            '--exclude=coding_prompts/',
-            '--exclude=prototype/',
-            '--exclude=tasks/',
-        ]
+        # Use rsync with explicit exclusions; a directory-only exclude prunes the
+        # whole subtree, so rsync never reads what is inside it
+        exclude_patterns = [f'--exclude={name}/' for name in self._ORCHESTRATION_EXCLUDES]
 
-        cmd = ['rsync', '-av'] + exclude_patterns + [f"{source_dir}/", f"{target_dir}/"]
+        # Local copy into a fresh directory: whole files written in place, no
+        # compression, and no per-file listing since nothing reads it
+        cmd = ['rsync', '-aW', '--inplace', '--no-compress'] + exclude_patterns + [f"{source_dir}/", f"{target_dir}/"]
 
         try:
             result = subprocess.run(cmd, capture_output=True, text=True)
@@ -295,39 +519,45 @@ class ClaudeCommandsExporter:
 
     def _copy_orchestration_manual(self, source_dir, target_dir):
         """Manual orchestration copy with exclusions for Windows compatibility"""
-        excluded_dirs = {'analysis', 'automation', 'claude-bot-commands', 'coding_prompts', 'prototype', 'tasks'}
-        
-        import shutil
-        for root, dirs, files in os.walk(source_dir):
-            # Filter out excluded directories
-            dirs[:] = [d for d in dirs if d not in excluded_dirs]
-            
-            rel_path = os.path.relpath(root, source_dir)
-            target_root = os.path.join(target_dir, rel_path) if rel_path != '.' else target_dir
-            os.makedirs(target_root, exist_ok=True)
-            
-            for file in files:
-                src_file = os.path.join(root, file)
-                dst_file = os.path.join(target_root, file)
-                shutil.copy2(src_file, dst_file)
+        # Filter out excluded directories
+        _scandir_copy(source_dir, target_dir, set(self._ORCHESTRATION_EXCLUDES))
         
         print("✅ Orchestration exported using manual copy (excluded specified directories)")
 
+    def _filter_files(self, file_paths):
+        """Apply content filtering to exported files concurrently"""
+        if not file_paths:
+            return
+        # Each file runs in a copy of the caller's context, so warnings land in
+        # the calling section's output
+        pool = _filter_pool()
+        futures = [pool.submit(contextvars.copy_context().run, self._apply_content_filtering, path)
+                   for path in file_paths]
+        for future in futures:
+            future.result()
+
     def _apply_content_filtering(self, file_path):
         """Apply content transformations to files"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with open(file_path, 'rb') as f:
+                data = f.read()
 
             # Apply transformations - FIXED: These now perform actual replacements
-            content = re.sub(r'mvp_site/', '$PROJECT_ROOT/', content)
-            content = re.sub(r'worldarchitect\.ai', 'your-project.com', content)
-            content = re.sub(r'\bjleechan\b', '$USER', content)
-            content = re.sub(r'TESTING=true vpython', 'TESTING=true python', content)
-            content = re.sub(r'WorldArchitect\.AI', 'Your Project', content)
+            if data.isascii():
+                # The usual case: substitute on the raw bytes, no UTF-8 round trip
+                data, replaced = self._FILTER_PATTERN_BYTES.subn(lambda m: self._FILTER_MAP_BYTES[m.group(0)], data)
+            else:
+                # Non-ASCII text keeps Unicode word boundaries for \bjleechan
+                content, replaced = self._FILTER_PATTERN.subn(
+                    lambda m: self._FILTER_MAP[m.group(0)], data.decode('utf-8'))
+                data = content.encode('utf-8')
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Files without any placeholders are left untouched on disk
+            if not replaced:
+                return
+
+            with open(file_path, 'wb') as f:
+                f.write(data)
 
         except Exception as e:
             print(f"⚠️  Warning: Content filtering failed for {file_path}: {e}")
@@ -341,15 +571,20 @@ class ClaudeCommandsExporter:
         pass
 
     def _detect_version(self):
+        """Detect the version, reusing the last result while VERSION and package.json are unchanged"""
+        stamp = tuple(_mtime_ns(os.path.join(self.project_root, name)) for name in ('VERSION', 'package.json'))
+        if self._detected_version is None or self._detected_version[0] != stamp:
+            self._detected_version = (stamp, self._probe_version())
+        return self._detected_version[1]
+
+    def _probe_version(self):
         """Intelligently detect version number using multiple strategies"""
         try:
             # Strategy 1: Try to get latest git tag that looks like a version
-            result = subprocess.run(['git', 'describe', '--tags', '--abbrev=0'], 
-                                  capture_output=True, text=True, cwd=self.project_root)
-            if result.returncode == 0:
-                tag = result.stdout.strip()
+            tag = _git_latest_tag(self.project_root)
+            if tag is not None:
                 # Extract version from tag (handle v1.2.3 or 1.2.3 formats)
-                version_match = re.search(r'v?(\d+\.\d+\.\d+)', tag)
+                version_match = _TAG_VERSION_RE.search(tag)
                 if version_match:
                     version = version_match.group(1)
                     print(f"   📋 Found git tag version: {version}")
@@ -398,44 +633,40 @@ class ClaudeCommandsExporter:
         print(f"   📋 Using v1.1.0 for command count consistency fixes")
         return version
     
+    def _fetch_target_readme(self):
+        """Get the target repository README text, fetched once ('' if unavailable)"""
+        if self._target_readme is None:
+            try:
+                url = "https://raw.githubusercontent.com/jleechanorg/claude-commands/main/README.md"
+                response = requests.get(url, timeout=10)
+                self._target_readme = response.text if response.status_code == 200 else ""
+            except Exception as e:
+                print(f"   ⚠️ Could not fetch target README: {e}")
+                self._target_readme = ""
+        return self._target_readme
+
     def _get_existing_version_from_target(self):
         """Get the latest version from target repository README"""
-        try:
-            import requests
-            url = "https://raw.githubusercontent.com/jleechanorg/claude-commands/main/README.md"
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                content = response.text
-                # Look for version patterns like ### v1.2.3
-                import re
-                versions = re.findall(r'### v(\d+\.\d+\.\d+)', content)
-                if versions:
-                    # Return the latest version (first one found, assuming newest first)
-                    latest = versions[0]
-                    print(f"   📋 Found existing version in target: v{latest}")
-                    return latest
-        except Exception as e:
-            print(f"   ⚠️ Could not fetch existing version: {e}")
+        content = self._fetch_target_readme()
+        # Look for version patterns like ### v1.2.3
+        versions = _VERSION_TAG_RE.findall(content)
+        if versions:
+            # Return the latest version (first one found, assuming newest first)
+            latest = versions[0]
+            print(f"   📋 Found existing version in target: v{latest}")
+            return latest
         return None
     
     def _get_existing_version_history(self, content):
         """Extract existing version history from target repository content"""
-        try:
-            import requests
-            url = "https://raw.githubusercontent.com/jleechanorg/claude-commands/main/README.md"
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                existing_content = response.text
-                # Extract the version history section
-                import re
-                version_section_match = re.search(r'## 📚 Version History\s*\n\n(.*?)(?=\n---|\nGenerated with|\Z)', existing_content, re.DOTALL)
-                if version_section_match:
-                    existing_history = version_section_match.group(1).strip()
-                    if existing_history and not existing_history.startswith('<!--'):
-                        print(f"   📋 Found existing version history ({len(existing_history)} chars)")
-                        return existing_history
-        except Exception as e:
-            print(f"   ⚠️ Could not fetch existing version history: {e}")
+        existing_content = self._fetch_target_readme()
+        # Extract the version history section
+        version_section_match = _VERSION_SECTION_RE.search(existing_content)
+        if version_section_match:
+            existing_history = version_section_match.group(1).strip()
+            if existing_history and not existing_history.startswith('<!--'):
+                print(f"   📋 Found existing version history ({len(existing_history)} chars)")
+                return existing_history
         return None
     
     def _increment_version(self, version):
@@ -528,10 +759,9 @@ class ClaudeCommandsExporter:
 - Improved troubleshooting guides for export issues'''
 
         # Replace the LLM placeholder section (with whitespace tolerance)
-        llm_pattern = r'<!--\s*LLM_VERSION_START\s*-->.*?<!--\s*LLM_VERSION_END\s*-->'
         replacement = version_entry
         
-        content = re.sub(llm_pattern, replacement, content, flags=re.DOTALL)
+        content = _LLM_PLACEHOLDER_RE.sub(replacement, content)
         
         return content
 
@@ -694,15 +924,13 @@ This is a filtered reference export from a working Claude Code project. Commands
         archive_name = f"claude_commands_export_{time.strftime('%Y%m%d_%H%M%S')}.tar.gz"
         archive_path = os.path.join(self.export_dir, archive_name)
 
-        cmd = [
-            'tar', '-czf', archive_path,
-            '-C', self.export_dir,
-            'staging/', 'README.md'
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"⚠️  Archive creation failed: {result.stderr}")
+        # Built in-process; fast gzip level since the archive is a convenience copy
+        try:
+            with tarfile.open(archive_path, 'w:gz', compresslevel=1) as tf:
+                tf.add(os.path.join(self.export_dir, 'staging'), arcname='staging')
+                tf.add(os.path.join(self.export_dir, 'README.md'), arcname='README.md')
+        except (OSError, tarfile.TarError) as e:
+            print(f"⚠️  Archive creation failed: {e}")
         else:
             print(f"✅ Created archive: {archive_name}")
 
@@ -58,6 +58,13 @@ class FakeDetector:
                 )
             ]
 
+    def analyze_content(self, content: str, filepath: str) -> List[FakePattern]:
+        """Analyze already-read file content; AST checks only run for .py files"""
+        patterns = self._check_text_patterns(content, filepath)
+        if filepath.endswith(".py"):
+            patterns.extend(self._check_ast_patterns(content, filepath))
+        return patterns
+
     def analyze_code_string(
         self, code: str, context: str = "code"
     ) -> List[FakePattern]:
@@ -340,6 +340,16 @@ export USER="jleechan"
                             result = self.exporter._create_pull_request()
                             self.assertIn('github.com', result)
 
+    @unittest.skipIf(ClaudeCommandsExporter is None, "ClaudeCommandsExporter not available")
+    def test_missing_token_fails_before_local_export(self):
+        """Test that export aborts on a missing GITHUB_TOKEN before Phase 1 runs."""
+        self.exporter.github_token = None
+        
+        with patch.object(self.exporter, 'phase1_local_export') as mock_phase1:
+            with self.assertRaises(SystemExit):
+                self.exporter.export()
+            mock_phase1.assert_not_called()
+
     def test_error_handling_matrix(self):
         """Test error handling across different failure scenarios."""
         if ClaudeCommandsExporter is None:
@@ -472,6 +482,7 @@ export DOMAIN="worldarchitect.ai"
         
         # Create a mock rsync that actually creates files
         def mock_rsync_side_effect(*args, **kwargs):
+            transferred = []
             if 'rsync' in args[0] and args[0][0] == 'rsync':
                 # This is a hooks export rsync call
                 target_dir = args[0][-1].rstrip('/')  # Last argument is target
@@ -484,10 +495,12 @@ export DOMAIN="worldarchitect.ai"
                             f.write(f"# Test hook: {hook}")
                         if hook.endswith('.sh'):
                             os.chmod(hook_path, 0o755)
+                        transferred.append(hook)
             
             mock_result = Mock()
             mock_result.returncode = 0
-            mock_result.stdout = ''
+            # Report the created files like rsync --out-format=%n
+            mock_result.stdout = ''.join(f"{name}\n" for name in transferred)
             mock_result.stderr = ''
             return mock_result
         